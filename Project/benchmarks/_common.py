@@ -0,0 +1,38 @@
+"""Shared setup for the scripts in this directory: each one runs against a scratch database, never domain_portal.db."""
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_app(database_url=None):
+    """Import app.py against database_url (default: a new SQLite file in a temp dir) and return the module."""
+    if database_url is None:
+        database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='domainhub-bench-'), 'bench.db')
+    os.environ['DATABASE_URL'] = database_url
+    sys.path.insert(0, PROJECT_DIR)
+    import app as app_module
+    app_module.app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+    return app_module
+
+
+def reset_database(app_module):
+    db = app_module.db
+    with app_module.app.app_context():
+        db.drop_all()
+        db.create_all()
+        app_module.ensure_search_index()
+
+
+def median_ms(fn, repeat):
+    """Median wall time of fn() over repeat runs, in milliseconds (after one warm-up call)."""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples)
@@ -0,0 +1,71 @@
+"""Admin domain search: FTS5 trigram index vs the ILIKE fallback, first page of results through the real endpoint.
+
+    python Project/benchmarks/bench_admin_search.py [--domains 100000] [--repeat 15]
+
+Both paths run the same /api/admin/all-domains request; the ILIKE run just reports the index as unavailable.
+The script also checks that both paths return the same page.
+"""
+import argparse
+
+from _common import load_app, reset_database, median_ms
+
+TERMS = [
+    ('alpha', 'rare substring'),
+    ('site123', 'name prefix'),
+    ('zzzz', 'no match'),
+    ('user7', 'dense owner match'),
+]
+
+
+def seed(app_module, domain_count):
+    db, User, Domain = app_module.db, app_module.User, app_module.Domain
+    with app_module.app.app_context():
+        admin = User(username='admin', name='Admin', role='admin', email='admin@example.com')
+        admin.set_password('pw')
+        db.session.add(admin)
+        owner_count = max(domain_count // 100, 1)
+        db.session.execute(db.insert(User), [{'username': f'user{i}', 'name': f'Client {i}', 'role': 'client',
+                                              'email': f'user{i}@example.com', 'password_hash': 'x', 'is_active': True}
+                                             for i in range(owner_count)])
+        owner_ids = [user_id for (user_id,) in db.session.query(User.id).filter(User.role == 'client')]
+        rows = [{'name': f'{"alpha" if i % 20000 == 0 else "site"}{i}.com', 'user_id': owner_ids[i % len(owner_ids)],
+                 'status': 'Active', 'auto_renew': False, 'is_locked': True, 'version': 1} for i in range(domain_count)]
+        for start in range(0, len(rows), 10000):
+            db.session.execute(db.insert(Domain), rows[start:start + 10000])
+        db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--domains', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=15)
+    parser.add_argument('--database-url', help='Scratch database (default: a temporary SQLite file)')
+    args = parser.parse_args()
+
+    app_module = load_app(args.database_url)
+    reset_database(app_module)
+    seed(app_module, args.domains)
+    client = app_module.app.test_client()
+    client.post('/login', data={'username': 'admin', 'password': 'pw'})
+    with app_module.app.app_context():
+        if not app_module.ensure_search_index():
+            raise SystemExit('FTS5 with the trigram tokenizer is not available in this SQLite build.')
+
+    def page(term):
+        response = client.get(f'/api/admin/all-domains?search_term={term}&limit=50')
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return [domain['id'] for domain in response.json['domains']]
+
+    print(f"{args.domains} domains, first page of 50")
+    for term, label in TERMS:
+        app_module._search_index_present = True
+        fts_ids, fts_ms = page(term), median_ms(lambda: page(term), args.repeat)
+        app_module._search_index_present = False
+        like_ids, like_ms = page(term), median_ms(lambda: page(term), args.repeat)
+        assert fts_ids == like_ids, f"{term!r}: FTS and ILIKE pages differ"
+        print(f"  {term!r:10} ({label:18}) fts {fts_ms:7.1f} ms   ilike {like_ms:7.1f} ms   {len(fts_ids)} rows")
+    app_module._search_index_present = None
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""Email delivery throughput: a new SMTP session per message (mail.send) vs one pooled session (PooledMailConnection),
+plus a full outbox drain (deliver_outbox_batch), against a local SMTP sink started by this script.
+
+    python Project/benchmarks/bench_mail_pool.py [--messages 300] [--tls-cert cert.pem --tls-key key.pem]
+
+With a certificate the sink requires STARTTLS, which is where per-message handshakes cost the most.
+"""
+import argparse
+import socket
+import socketserver
+import ssl
+import threading
+import time
+
+from _common import load_app, reset_database
+
+
+class SinkHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP (EHLO/STARTTLS/MAIL/RCPT/DATA/RSET/NOOP/QUIT) to accept and count messages."""
+    def reply(self, *lines):
+        # One write per command: a multi-line EHLO sent line by line stalls on Nagle + delayed ACK
+        self.wfile.write(b''.join(line.encode() + b'\r\n' for line in lines))
+        self.wfile.flush()
+
+    def handle(self):
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reply('220 bench-sink ESMTP')
+        while True:
+            line = self.rfile.readline()
+            if not line: return
+            verb = line.decode(errors='replace').strip().split(' ', 1)[0].upper()
+            if verb in ('EHLO', 'HELO'):
+                extensions = ['250-bench-sink', '250-8BITMIME']
+                if self.server.tls_context and not isinstance(self.connection, ssl.SSLSocket): extensions.append('250-STARTTLS')
+                extensions[-1] = extensions[-1].replace('250-', '250 ', 1)
+                self.reply(*extensions)
+            elif verb == 'STARTTLS' and self.server.tls_context:
+                self.reply('220 Ready to start TLS')
+                self.connection = self.server.tls_context.wrap_socket(self.connection, server_side=True)
+                self.rfile, self.wfile = self.connection.makefile('rb'), self.connection.makefile('wb')
+            elif verb == 'DATA':
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+                while self.rfile.readline() not in (b'.\r\n', b''): pass
+                with self.server.lock: self.server.received += 1
+                self.reply('250 OK')
+            elif verb == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('250 OK')
+
+
+class SmtpSink(socketserver.ThreadingTCPServer):
+    daemon_threads = allow_reuse_address = True
+
+    def __init__(self, tls_context=None):
+        super().__init__(('127.0.0.1', 0), SinkHandler)
+        self.tls_context, self.received, self.lock = tls_context, 0, threading.Lock()
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--messages', type=int, default=300)
+    parser.add_argument('--tls-cert')
+    parser.add_argument('--tls-key')
+    args = parser.parse_args()
+
+    tls_context = None
+    if args.tls_cert:
+        tls_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        tls_context.load_cert_chain(args.tls_cert, args.tls_key)
+    sink = SmtpSink(tls_context)
+
+    app_module = load_app()
+    app, db, mail, Message = app_module.app, app_module.db, app_module.mail, app_module.Message
+    app.config.update(MAIL_SERVER='127.0.0.1', MAIL_PORT=sink.server_address[1], MAIL_USE_TLS=bool(tls_context),
+                      MAIL_USE_SSL=False, MAIL_USERNAME=None, MAIL_PASSWORD=None, MAIL_SUPPRESS_SEND=False, TESTING=False)
+    mail.init_app(app)
+    reset_database(app_module)
+    message = lambda: Message('Benchmark', recipients=['client@example.com'], html='<p>Hello</p>')
+    n = args.messages
+    print(f"{n} messages, {'STARTTLS' if tls_context else 'plaintext'} sink")
+
+    with app.app_context():
+        started = time.perf_counter()
+        for _ in range(n): mail.send(message())
+        print(f"  per-message mail.send      {n / (time.perf_counter() - started):6.0f} msg/s")
+
+        connection = app_module.PooledMailConnection()
+        started = time.perf_counter()
+        for _ in range(n): connection.send(message())
+        connection.close()
+        print(f"  pooled session             {n / (time.perf_counter() - started):6.0f} msg/s")
+
+        db.session.add_all([app_module.EmailOutbox(recipients=['client@example.com'], subject='Benchmark', html_body='<p>Hello</p>')
+                            for _ in range(n)])
+        db.session.commit()
+        started = time.perf_counter()
+        while sum(app_module.deliver_outbox_batch()): pass
+        print(f"  outbox drain (pooled)      {n / (time.perf_counter() - started):6.0f} msg/s  (includes a commit per message)")
+
+    assert sink.received == 3 * n, f"sink received {sink.received} of {3 * n} messages"
+
+
+if __name__ == '__main__':
+    main()
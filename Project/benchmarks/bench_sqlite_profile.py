@@ -0,0 +1,105 @@
+"""SQLite write contention: SQLite's built-in settings vs the app's SQLITE_* profile (WAL, synchronous=NORMAL, ...),
+with writer and reader processes sharing one database file.
+
+    python Project/benchmarks/bench_sqlite_profile.py [--writers 4] [--readers 4] [--seconds 10]
+
+Each writer transaction reads a notification feed, then inserts a notification and a domain request; each reader
+reads the feed and counts requests. Every process imports app.py on its own, as separate web workers would, so the
+profile is chosen through the environment before the processes are spawned. Run it on the disk that will hold the
+production database: the numbers are dominated by fsync.
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+PROFILES = {
+    'sqlite defaults': {'SQLITE_BUSY_TIMEOUT_MS': '', 'SQLITE_JOURNAL_MODE': 'DELETE', 'SQLITE_SYNCHRONOUS': '',
+                        'SQLITE_MMAP_SIZE': '', 'SQLITE_CACHE_SIZE': '', 'SQLITE_TEMP_STORE': ''},
+    'app profile': {}, # The defaults in app.py (or whatever SQLITE_* is set in this shell)
+}
+USERS = 4
+
+
+def setup(database_url):
+    from _common import load_app, reset_database
+    app_module = load_app(database_url)
+    reset_database(app_module)
+    db, User = app_module.db, app_module.User
+    with app_module.app.app_context():
+        db.session.add_all([User(username=f'user{k}', name=f'User {k}', role='client', email=f'user{k}@example.com', password_hash='x')
+                            for k in range(USERS)])
+        db.session.commit()
+
+
+def worker(database_url, index, writes, seconds, barrier, results):
+    from _common import load_app
+    app_module = load_app(database_url)
+    db, Notification, DomainRequest = app_module.db, app_module.Notification, app_module.DomainRequest
+    committed = locked = 0
+    latencies = []
+    with app_module.app.app_context():
+        user_id = db.session.query(app_module.User.id).filter_by(username=f'user{index % USERS}').scalar()
+        db.session.commit()
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                Notification.query.filter_by(user_id=user_id).order_by(Notification.id.desc()).limit(20).all()
+                if writes:
+                    attempt = len(latencies)
+                    app_module.create_notification(user_id, f'Benchmark {index}-{attempt}', notification_type='bench')
+                    db.session.add(DomainRequest(user_id=user_id, domain_name=f'bench{index}-{attempt}.com', request_type='register', requested_data={}))
+                else:
+                    db.session.query(db.func.count(DomainRequest.id)).filter_by(user_id=user_id).scalar()
+                db.session.commit()
+                committed += 1
+            except Exception as e:
+                db.session.rollback()
+                if 'locked' not in str(e): raise
+                locked += 1
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    results.put((writes, committed, locked, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]))
+
+
+def run(profile, args):
+    os.environ.update(PROFILES[profile]) # Inherited by the spawned processes, which import app.py afresh
+    database_url = 'sqlite:///' + os.path.join(tempfile.mkdtemp(prefix='domainhub-bench-'), 'bench.db')
+    context = multiprocessing.get_context('spawn')
+    process = context.Process(target=setup, args=(database_url,))
+    process.start()
+    process.join()
+    results, barrier = context.Queue(), context.Barrier(args.writers + args.readers)
+    processes = [context.Process(target=worker, args=(database_url, i, i < args.writers, args.seconds, barrier, results))
+                 for i in range(args.writers + args.readers)]
+    for process in processes: process.start()
+    outcomes = [results.get() for _ in processes]
+    for process in processes: process.join()
+
+    print(f"{profile}:")
+    for label, writes in (('writes', True), ('reads', False)):
+        rows = [row for row in outcomes if row[0] == writes]
+        if not rows: continue
+        print(f"  {label:6} {sum(row[1] for row in rows) / args.seconds:6.0f}/s   p50 {max(row[3] for row in rows) * 1000:7.1f} ms"
+              f"   p99 {max(row[4] for row in rows) * 1000:7.1f} ms   {sum(row[2] for row in rows)} 'database is locked' errors")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--readers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=10)
+    args = parser.parse_args()
+    print(f"{args.writers} writer + {args.readers} reader processes, {args.seconds:g}s per profile")
+    saved = dict(os.environ)
+    for profile in PROFILES:
+        run(profile, args)
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+if __name__ == '__main__':
+    main()
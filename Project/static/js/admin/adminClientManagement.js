@@ -1,5 +1,6 @@
 // Project/static/js/admin/adminClientManagement.js
 import { getAllClientsAdmin, createClientAdmin, editClientAdmin, toggleClientActiveStatusAdmin, getClientDetailsAdmin } from './apiAdminService.js';
+import { createInfiniteScroll } from '../common/infiniteScroll.js';
 import { showMessage as showAdminMessage } from '../common/messageBox.js';
 import { openModal, closeModal, resetModalForm } from '../common/modalUtils.js';
 import { formatSimpleDate } from '../common/dateUtils.js';
@@ -35,6 +36,7 @@ const clientDetailTicketsPlaceholderEl = () => document.getElementById('client-d
 const toggleClientActiveDetailTextEl = () => document.getElementById('toggle-client-active-detail-text');
 
 let allClientsDataCache = [];
+let clientsInfiniteScroll = null;
 
 export function initializeClientManagement() {
     const tableBody = allClientsTableBodyEl();
@@ -89,10 +91,16 @@ export function initializeClientManagement() {
 
 export async function fetchAllClients() {
     const tableBody = allClientsTableBodyEl();
-    if (tableBody) tableBody.innerHTML = `<tr><td colspan="7" class="text-center p-4 placeholder-text">Loading clients...</td></tr>`;
+    if (!tableBody) return;
+    tableBody.innerHTML = `<tr><td colspan="7" class="text-center p-4 placeholder-text">Loading clients...</td></tr>`;
     try {
-        allClientsDataCache = await getAllClientsAdmin() || [];
-        if (tableBody) renderAllClientsTable(allClientsDataCache);
+        if (!clientsInfiniteScroll) {
+            clientsInfiniteScroll = createInfiniteScroll(tableBody.closest('table') || tableBody, (page, append) => {
+                allClientsDataCache = append ? allClientsDataCache.concat(page.clients) : page.clients;
+                renderAllClientsTable(page.clients, append);
+            });
+        }
+        await clientsInfiniteScroll.start(cursor => getAllClientsAdmin(cursor));
     } catch (error) {
         console.error("Error fetching all clients:", error);
         if (tableBody) tableBody.innerHTML = `<tr><td colspan="7" class="text-center p-4 error-text">Error loading clients.</td></tr>`;
@@ -100,12 +108,12 @@ export async function fetchAllClients() {
     }
 }
 
-export function renderAllClientsTable(clients) {
+export function renderAllClientsTable(clients, append = false) {
     const tableBody = allClientsTableBodyEl();
     if (!tableBody) return;
-    tableBody.innerHTML = '';
+    if (!append) tableBody.innerHTML = '';
 
-    if (!clients || clients.length === 0) {
+    if (!append && (!clients || clients.length === 0)) {
         tableBody.innerHTML = '<tr><td colspan="7" class="text-center p-4 placeholder-text">No clients found.</td></tr>';
         return;
     }
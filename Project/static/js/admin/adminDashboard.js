@@ -45,7 +45,7 @@ export async function fetchRecentPendingOverview() {
                         } else if (action === 'Approved' || action === 'Rejected' || action === 'EPP Code Sent' || action === 'Processing' || action === 'Info Requested' || action === 'Completed' || action === 'Failed' || action === 'Needs Info' || action === 'Needs Clarification' || action === 'Cancelled by Client') {
                             // For actions that require notes (Approve, Reject, etc.)
                             const currentRequestData = items.find(i => i.id.toString() === requestId && i.requestType === reqTypeFromButton);
-                            showAdminNotesModal(requestId, reqTypeFromButton, action, currentRequestData ? currentRequestData.admin_notes || '' : '');
+                            showAdminNotesModal(requestId, reqTypeFromButton, action, currentRequestData ? currentRequestData.admin_notes || '' : '', currentRequestData ? currentRequestData.version : null);
                         } else {
                             // Fallback or other specific actions for overview cards if needed
                             console.warn(`Overview card button action '${action}' for type '${reqTypeFromButton}' not explicitly handled for direct action.`);
@@ -1,11 +1,12 @@
 // Project/static/js/admin/adminDomainManagement.js
-import { getAllAdminDomains, getDomainDetailsAdmin, reassignDomainOwnerAdmin, getAllClientsAdmin as fetchAllClientsForDropdown } from './apiAdminService.js'; // Renamed import for clarity
+import { getAllAdminDomains, getDomainDetailsAdmin, reassignDomainOwnerAdmin, getAllClientsAdmin, fetchAllPages } from './apiAdminService.js';
 import { showMessage as showAdminMessage } from '../common/messageBox.js';
 import { openModal, closeModal, resetModalForm } from '../common/modalUtils.js';
 import { formatSimpleDate } from '../common/dateUtils.js';
 import { showAdminSection, getAdminPageElement, createAdminIcon } from './adminUI.js';
 import { openAdminTicketDetailModal } from './adminTicketManagement.js';
 import { fetchAllClients } from './adminClientManagement.js'; // <<< ADDED THIS IMPORT for refreshing client list views
+import { createInfiniteScroll } from '../common/infiniteScroll.js';
 
 // DOM Elements
 const allDomainsTableBodyEl = () => document.getElementById('all-domains-table-body');
@@ -38,6 +39,9 @@ const reassignNewOwnerSelectEl = () => document.getElementById('reassignNewOwner
 const reassignNewOwnerErrorEl = () => document.getElementById('reassignNewOwnerError');
 
 let allClientsCacheForDropdown = []; // Separate cache for dropdown population
+let domainsInfiniteScroll = null;
+
+const fetchAllClientsForDropdown = () => fetchAllPages(cursor => getAllClientsAdmin(cursor), 'clients');
 
 export function initializeDomainManagement() {
     initializeDomainFilters();
@@ -134,11 +138,10 @@ export async function fetchAllAdminDomains(filters = {}) {
     if (!tableBody) return;
     tableBody.innerHTML = `<tr><td colspan="8" class="text-center p-4 placeholder-text">Loading all domains...</td></tr>`;
     try {
-        const domains = await getAllAdminDomains(filters);
-        renderAllDomainsTable(domains);
-        if (Object.keys(filters).length === 0) { // Only repopulate client filter if no filters applied initially
-            // await populateDomainClientFilter(); // This might be redundant if called in initializeDomainFilters
+        if (!domainsInfiniteScroll) {
+            domainsInfiniteScroll = createInfiniteScroll(tableBody.closest('table') || tableBody, (page, append) => renderAllDomainsTable(page.domains, append));
         }
+        await domainsInfiniteScroll.start(cursor => getAllAdminDomains(filters, cursor));
     } catch (error) {
         console.error("Error fetching all domains for admin:", error);
         if(tableBody) tableBody.innerHTML = `<tr><td colspan="8" class="text-center p-4 error-text">Error loading domains. ${error.message}</td></tr>`;
@@ -146,12 +149,12 @@ export async function fetchAllAdminDomains(filters = {}) {
     }
 }
 
-export function renderAllDomainsTable(domains) {
+export function renderAllDomainsTable(domains, append = false) {
     const tableBody = allDomainsTableBodyEl();
     if (!tableBody) return;
-    tableBody.innerHTML = '';
+    if (!append) tableBody.innerHTML = '';
 
-    if (!domains || domains.length === 0) {
+    if (!append && (!domains || domains.length === 0)) {
         tableBody.innerHTML = '<tr><td colspan="8" class="text-center p-4 placeholder-text">No domains found matching your criteria.</td></tr>';
         return;
     }
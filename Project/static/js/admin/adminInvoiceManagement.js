@@ -6,13 +6,20 @@ import {
     getInvoiceDetailsAdmin,
     markInvoicePaidAdmin,
     cancelInvoiceAdmin,
-    getAllClientsAdmin as fetchAllClientsForInvoiceFilter, // Used for populating client dropdown
-    getAllAdminDomains as fetchAllDomainsForInvoiceFilter  // Used for populating domain dropdown
+    getAllClientsAdmin,
+    getAllAdminDomains,
+    fetchAllPages
 } from './apiAdminService.js';
+import { createInfiniteScroll } from '../common/infiniteScroll.js';
 import { openModal, closeModal, resetModalForm } from '../common/modalUtils.js';
 import { formatSimpleDate } from '../common/dateUtils.js';
 import { getAdminPageElement, createAdminIcon } from './adminUI.js';
 
+// Dropdowns need every client/domain, so they walk all pages of the paginated lists
+const fetchAllClientsForInvoiceFilter = () => fetchAllPages(cursor => getAllClientsAdmin(cursor), 'clients');
+const fetchAllDomainsForInvoiceFilter = () => fetchAllPages(cursor => getAllAdminDomains({}, cursor), 'domains');
+let invoicesInfiniteScroll = null;
+
 
 const allInvoicesTableBodyEl = () => document.getElementById('all-invoices-table-body');
 const invoiceFiltersFormEl = () => document.getElementById('invoice-filters-form');
@@ -145,8 +152,10 @@ export async function fetchAllAdminInvoices(filters = {}) {
     if (!tableBody) return;
     tableBody.innerHTML = `<tr><td colspan="8" class="text-center p-4 placeholder-text">Loading invoices...</td></tr>`;
     try {
-        const invoices = await getAllAdminInvoices(filters); // <<< CORRECTED FUNCTION CALL
-        renderAllInvoicesTable(invoices);
+        if (!invoicesInfiniteScroll) {
+            invoicesInfiniteScroll = createInfiniteScroll(tableBody.closest('table') || tableBody, (page, append) => renderAllInvoicesTable(page.invoices, append));
+        }
+        await invoicesInfiniteScroll.start(cursor => getAllAdminInvoices(filters, cursor));
     } catch (error) {
         console.error("Error fetching all invoices for admin:", error);
         if(tableBody) tableBody.innerHTML = `<tr><td colspan="8" class="text-center p-4 error-text">Error loading invoices: ${error.message}</td></tr>`;
@@ -154,12 +163,12 @@ export async function fetchAllAdminInvoices(filters = {}) {
     }
 }
 
-function renderAllInvoicesTable(invoices) {
+function renderAllInvoicesTable(invoices, append = false) {
     const tableBody = allInvoicesTableBodyEl();
     if (!tableBody) return;
-    tableBody.innerHTML = '';
+    if (!append) tableBody.innerHTML = '';
 
-    if (!invoices || invoices.length === 0) {
+    if (!append && (!invoices || invoices.length === 0)) {
         tableBody.innerHTML = '<tr><td colspan="8" class="text-center p-4 placeholder-text">No invoices found matching your criteria.</td></tr>';
         return;
     }
@@ -1,8 +1,9 @@
 // Project/static/js/admin/adminRequestManagement.js
-import { getPendingRequests, updateRequestStatusAdmin } from './apiAdminService.js';
+import { getPendingRequests, updateRequestStatusAdmin, batchUpdateRequestStatusAdmin } from './apiAdminService.js';
 import { showMessage as showAdminMessage } from '../common/messageBox.js';
 import { closeModal } from '../common/modalUtils.js';
 import { renderRequestCard, internalRequestTypeForCardId, getAdminPageElement, showAdminNotesModal } from './adminUI.js';
+import { createInfiniteScroll } from '../common/infiniteScroll.js';
 
 // Import functions for refreshing *other* sections IF a request type implies it
 import { fetchAllAdminDomains } from './adminDomainManagement.js';
@@ -68,38 +69,168 @@ export function initializePendingRequestsTabs() {
     }
 }
 
+const pendingListScrollers = new Map(); // list element -> infinite scroll controller
+const batchToolbars = new Map(); // list element -> batch selection toolbar
+
+// Status the batch "Approve" button applies per request type; transfer-outs need a per-item EPP code, so no batch actions
+const BATCH_APPROVE_ACTIONS = { transfer_in: 'Processing' };
+const BATCH_UNSUPPORTED_TYPES = ['transfer_out'];
+
+function isBatchSelectable(item) {
+    return (item.status === 'Pending Admin Approval' || item.status === 'Pending') && !BATCH_UNSUPPORTED_TYPES.includes(item.requestType);
+}
+
+function selectedBatchCheckboxes(listElement) {
+    return Array.from(listElement.querySelectorAll('.batch-select-checkbox:checked'));
+}
+
+function updateBatchToolbar(listElement) {
+    const toolbar = batchToolbars.get(listElement);
+    if (!toolbar) return;
+    const total = listElement.querySelectorAll('.batch-select-checkbox').length;
+    const selected = selectedBatchCheckboxes(listElement).length;
+    toolbar.classList.toggle('hidden', total === 0);
+    toolbar.querySelector('.batch-selected-count').textContent = `${selected} selected`;
+    toolbar.querySelector('.batch-select-all').checked = total > 0 && selected === total;
+    toolbar.querySelectorAll('.batch-action').forEach(button => { button.disabled = selected === 0; });
+}
+
+function ensureBatchToolbar(listElement) {
+    let toolbar = batchToolbars.get(listElement);
+    if (toolbar) return toolbar;
+    toolbar = document.createElement('div');
+    toolbar.className = 'batch-toolbar hidden flex items-center space-x-3 mb-3 text-sm text-gray-300';
+    toolbar.innerHTML = `
+        <label class="flex items-center space-x-1"><input type="checkbox" class="batch-select-all"> <span>Select all</span></label>
+        <span class="batch-selected-count">0 selected</span>
+        <button class="batch-action btn btn-sm btn-success" data-batch-action="approve" disabled>Approve selected</button>
+        <button class="batch-action btn btn-sm btn-danger" data-batch-action="reject" disabled>Reject selected</button>
+    `;
+    toolbar.querySelector('.batch-select-all').addEventListener('change', (e) => {
+        listElement.querySelectorAll('.batch-select-checkbox').forEach(checkbox => { checkbox.checked = e.target.checked; });
+        updateBatchToolbar(listElement);
+    });
+    toolbar.querySelectorAll('.batch-action').forEach(button => {
+        button.addEventListener('click', () => processBatchStatusUpdate(listElement, button.dataset.batchAction));
+    });
+    listElement.insertAdjacentElement('beforebegin', toolbar);
+    batchToolbars.set(listElement, toolbar);
+    return toolbar;
+}
+
+function removePendingCard(type, requestId) {
+    const cardElementInTab = document.getElementById(`request-card-${internalRequestTypeForCardId(type)}-${requestId}`);
+    if (!cardElementInTab) return;
+    const listElement = cardElementInTab.parentElement;
+    cardElementInTab.classList.add('removing');
+    setTimeout(() => {
+        cardElementInTab.remove();
+        if (listElement && listElement.children.length === 0) {
+            const noItemsMsgText = listElement.dataset.noItemsMessage || `No more pending ${type.replace(/_/g, ' ')} requests.`;
+            listElement.innerHTML = `<p class="placeholder-text col-span-full">${noItemsMsgText}</p>`;
+        }
+        if (listElement) updateBatchToolbar(listElement);
+    }, 300);
+}
+
+function refreshSectionsAffectedBy(types) {
+    if (types.some(type => ['register', 'renew', 'transfer_in', 'transfer_out', 'internal_transfer_request'].includes(type))) fetchAllAdminDomains();
+    if (types.includes('internal_transfer_request')) fetchAllClients();
+    if (types.includes('payment_proof')) fetchAllAdminInvoices();
+}
+
+async function processBatchStatusUpdate(listElement, batchAction) {
+    const checkboxes = selectedBatchCheckboxes(listElement);
+    if (checkboxes.length === 0) return;
+    let adminNotes = null;
+    if (batchAction === 'reject') {
+        adminNotes = prompt(`Reject ${checkboxes.length} request(s)? Optional reason (sent to the clients):`, '');
+        if (adminNotes === null) return;
+    } else if (!confirm(`Approve ${checkboxes.length} selected request(s)?`)) {
+        return;
+    }
+    const items = checkboxes.map(checkbox => ({
+        request_id: parseInt(checkbox.dataset.id, 10),
+        status: batchAction === 'reject' ? 'Rejected' : (BATCH_APPROVE_ACTIONS[checkbox.dataset.type] || 'Approved'),
+        admin_notes: adminNotes || undefined,
+        version: checkbox.dataset.version ? parseInt(checkbox.dataset.version, 10) : undefined // Server answers 409/conflict if the request changed since it was listed
+    }));
+    const typeById = new Map(checkboxes.map(checkbox => [parseInt(checkbox.dataset.id, 10), checkbox.dataset.type]));
+    const toolbar = batchToolbars.get(listElement);
+    toolbar?.querySelectorAll('.batch-action').forEach(button => { button.disabled = true; });
+
+    try {
+        const responseData = await batchUpdateRequestStatusAdmin(items);
+        const { success, errors } = responseData.results;
+        success.forEach(result => removePendingCard(result.request_type, result.request_id));
+        if (errors.length) {
+            showAdminMessage(`${success.length} request(s) updated; ${errors.length} failed: ${errors.map(e => `#${e.request_id} (${e.error})`).join(', ')}`, 'error');
+        } else {
+            showAdminMessage(`${success.length} request(s) updated.`, 'success');
+        }
+        const completed = success.filter(result => ['Approved', 'Completed'].includes(result.status));
+        refreshSectionsAffectedBy([...new Set(completed.map(result => typeById.get(result.request_id) || result.request_type))]);
+    } catch (error) {
+        console.error("Error applying batch status update:", error);
+        showAdminMessage(`Error updating requests: ${error.message}`, 'error');
+    } finally {
+        updateBatchToolbar(listElement);
+    }
+}
+
+function appendPendingItemCards(items, listElement) {
+    items.forEach(item => {
+        const cardElement = renderRequestCard(item, false);
+        if (isBatchSelectable(item)) {
+            const selectLabel = document.createElement('label');
+            selectLabel.className = 'batch-select flex items-center space-x-1 text-xs text-gray-400 mb-2';
+            selectLabel.innerHTML = `<input type="checkbox" class="batch-select-checkbox" data-id="${item.id}" data-type="${item.requestType}" data-version="${item.version ?? ''}"> <span>Select</span>`;
+            selectLabel.querySelector('input').addEventListener('change', () => updateBatchToolbar(listElement));
+            cardElement.prepend(selectLabel);
+        }
+        cardElement.querySelectorAll('.actions button').forEach(button => {
+            button.addEventListener('click', (e) => {
+                e.stopPropagation();
+                const requestId = button.dataset.id;
+                const reqTypeFromButton = button.dataset.type;
+                const action = button.dataset.action;
+                const currentRequestData = items.find(i => i.id.toString() === requestId);
+
+                if (reqTypeFromButton === 'support-ticket' && action === 'view-ticket') {
+                    openAdminTicketDetailModal(requestId);
+                } else {
+                    // showAdminNotesModal is imported from adminUI.js
+                    showAdminNotesModal(requestId, reqTypeFromButton, action, currentRequestData ? currentRequestData.admin_notes || '' : '', currentRequestData ? currentRequestData.version : null);
+                }
+            });
+        });
+        listElement.appendChild(cardElement);
+    });
+    updateBatchToolbar(listElement);
+}
+
 export async function fetchAndDisplayPendingItems(requestCategoryForApi, listElement, noItemsMessage) {
     if (!listElement) { console.warn(`List element for ${requestCategoryForApi} not found.`); return; }
     listElement.innerHTML = `<p class="placeholder-text col-span-full">Loading ${requestCategoryForApi.replace(/_/g, ' ').replace(/-/g, ' ')} requests...</p>`;
     listElement.dataset.noItemsMessage = noItemsMessage;
+    ensureBatchToolbar(listElement);
+    updateBatchToolbar(listElement);
 
     try {
-        const items = await getPendingRequests(requestCategoryForApi);
-        listElement.innerHTML = '';
-        if (items && items.length > 0) {
-            items.forEach(item => {
-                const cardElement = renderRequestCard(item, false);
-                cardElement.querySelectorAll('.actions button').forEach(button => {
-                    button.addEventListener('click', (e) => {
-                        e.stopPropagation();
-                        const requestId = button.dataset.id;
-                        const reqTypeFromButton = button.dataset.type;
-                        const action = button.dataset.action;
-                        const currentRequestData = items.find(i => i.id.toString() === requestId);
-
-                        if (reqTypeFromButton === 'support-ticket' && action === 'view-ticket') {
-                            openAdminTicketDetailModal(requestId);
-                        } else {
-                            // showAdminNotesModal is imported from adminUI.js
-                            showAdminNotesModal(requestId, reqTypeFromButton, action, currentRequestData ? currentRequestData.admin_notes || '' : '');
-                        }
-                    });
-                });
-                listElement.appendChild(cardElement);
+        let scroller = pendingListScrollers.get(listElement);
+        if (!scroller) {
+            scroller = createInfiniteScroll(listElement, (page, append) => {
+                if (!append) listElement.innerHTML = '';
+                if (!append && page.requests.length === 0) {
+                    listElement.innerHTML = `<p class="placeholder-text col-span-full">${listElement.dataset.noItemsMessage}</p>`;
+                    updateBatchToolbar(listElement);
+                    return;
+                }
+                appendPendingItemCards(page.requests, listElement);
             });
-        } else {
-            listElement.innerHTML = `<p class="placeholder-text col-span-full">${noItemsMessage}</p>`;
+            pendingListScrollers.set(listElement, scroller);
         }
+        await scroller.start(cursor => getPendingRequests(requestCategoryForApi, cursor));
     } catch (error) {
         console.error(`Error fetching ${requestCategoryForApi} requests:`, error);
         if(listElement) listElement.innerHTML = `<p class="error-text col-span-full">Error loading ${requestCategoryForApi.replace(/_/g, ' ').replace(/-/g, ' ')} requests.</p>`;
@@ -107,10 +238,15 @@ export async function fetchAndDisplayPendingItems(requestCategoryForApi, listEle
     }
 }
 
-async function processRequestStatusUpdate(requestId, type, newStatus, notes, eppCode) {
+function readAdminNotesVersion() {
+    const versionEl = getAdminPageElement('adminNotesRequestVersion');
+    return versionEl && versionEl.value !== '' ? parseInt(versionEl.value, 10) : undefined;
+}
+
+async function processRequestStatusUpdate(requestId, type, newStatus, notes, eppCode, version) {
     try {
         // Corrected argument order: (requestType, requestId, status, adminNotes, additionalData)
-        const responseData = await updateRequestStatusAdmin(type, requestId, newStatus, notes, { epp_code: eppCode });
+        const responseData = await updateRequestStatusAdmin(type, requestId, newStatus, notes, { epp_code: eppCode, version });
         showAdminMessage(`Request ID ${requestId} (${type.replace(/_/g, ' ')}) status updated to ${responseData.item.status}.`, 'success');
 
         const nonPendingStatuses = ['Completed', 'Rejected', 'Failed', 'Resolved', 'Closed', 'Cancelled by Client', 'EPP Code Sent', 'Approved']; // Added 'Approved'
@@ -129,19 +265,7 @@ async function processRequestStatusUpdate(requestId, type, newStatus, notes, epp
 
             if (activeTabButton.dataset.tabTarget.includes(tabTargetExpectedSegment)) {
                 if (itemProcessedAndShouldBeRemoved) {
-                    const cardIdInTab = `request-card-${internalRequestTypeForCardId(type)}-${requestId}`;
-                    const cardElementInTab = document.getElementById(cardIdInTab);
-                    if (cardElementInTab) {
-                        cardElementInTab.classList.add('removing');
-                        setTimeout(() => {
-                            cardElementInTab.remove();
-                            const listElement = cardElementInTab.parentElement;
-                            if (listElement && listElement.children.length === 0) {
-                                const noItemsMsgText = listElement.dataset.noItemsMessage || `No more pending ${type.replace(/_/g, ' ')} requests.`;
-                                listElement.innerHTML = `<p class="placeholder-text col-span-full">${noItemsMsgText}</p>`;
-                            }
-                        }, 300);
-                    }
+                    removePendingCard(type, requestId);
                 } else {
                      if (typeof activeTabButton.click === 'function') activeTabButton.click(); // Refresh tab if item not removed
                 }
@@ -158,14 +282,8 @@ async function processRequestStatusUpdate(requestId, type, newStatus, notes, epp
         }
         const completedStatuses = ['Approved', 'Completed'];
         if (completedStatuses.includes(responseData.item.status)) {
-            if (['register', 'renew', 'transfer_in', 'transfer_out', 'internal_transfer_request'].includes(type)) {
-                fetchAllAdminDomains();
-            }
-            if (type === 'internal_transfer_request') {
-                fetchAllClients();
-            }
+            refreshSectionsAffectedBy([type]);
             if (type === 'payment_proof') {
-                fetchAllAdminInvoices();
                 const clientDetailSectionVisible = getAdminPageElement('client-detail-admin-section') && !getAdminPageElement('client-detail-admin-section').classList.contains('hidden');
                 if (clientDetailSectionVisible && responseData.item.userId) {
                      const clientDetailNameEl = getAdminPageElement('client-detail-name');
@@ -198,7 +316,7 @@ export async function handleAdminNotesFormSubmit(event) {
     const eppCode = (eppCodeContainer && !eppCodeContainer.classList.contains('hidden') && eppCodeTextEl && eppCodeTextEl.value.trim() !== "") ? eppCodeTextEl.value.trim() : null;
     
     // Corrected argument order: (requestId, type, newStatus, notes, eppCode)
-    const success = await processRequestStatusUpdate(requestIdEl.value, requestTypeEl.value, actionEl.value, notes, eppCode);
+    const success = await processRequestStatusUpdate(requestIdEl.value, requestTypeEl.value, actionEl.value, notes, eppCode, readAdminNotesVersion());
     if (adminNotesModal) closeModal(adminNotesModal);
     return success; 
 }
@@ -214,7 +332,7 @@ export async function handleSkipAdminNotes() {
     const eppCode = (eppCodeContainer && !eppCodeContainer.classList.contains('hidden') && eppCodeTextEl && eppCodeTextEl.value.trim() !== "") ? eppCodeTextEl.value.trim() : null;
     
     // Corrected argument order: (requestId, type, newStatus, notes, eppCode)
-    const success = await processRequestStatusUpdate(requestIdEl.value, requestTypeEl.value, actionEl.value, '', eppCode);
+    const success = await processRequestStatusUpdate(requestIdEl.value, requestTypeEl.value, actionEl.value, '', eppCode, readAdminNotesVersion());
     if (adminNotesModal) closeModal(adminNotesModal);
     return success;
 }
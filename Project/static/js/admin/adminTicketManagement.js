@@ -4,11 +4,13 @@ import {
     getAllAdminSupportTickets, 
     adminReplyToTicket, 
     updateRequestStatusAdmin,
-    getAdminTicketDetails // <<< ADDED IMPORT
+    getAdminTicketDetails, // <<< ADDED IMPORT
+    getTicketRepliesAdmin
 } from './apiAdminService.js';
 import { openModal, closeModal, resetModalForm } from '../common/modalUtils.js';
 import { formatSimpleDate, formatDateDetailed } from '../common/dateUtils.js';
 import { createAdminIcon, getAdminPageElement } from './adminUI.js';
+import { createInfiniteScroll } from '../common/infiniteScroll.js';
 
 // ... (DOM Element getters - remain the same)
 const allSupportTicketsListEl = () => document.getElementById('all-support-tickets-list');
@@ -34,14 +36,20 @@ const ticketDetailReopenButtonEl = () => document.getElementById('ticket-detail-
 
 let currentOpenTicketId = null;
 let allAdminTicketsCache = [];
+let ticketsInfiniteScroll = null;
 
 export async function fetchAllAdminSupportTickets() {
     const listEl = allSupportTicketsListEl();
     if (!listEl) return;
     listEl.innerHTML = `<p class="placeholder-text col-span-full">Loading support tickets...</p>`;
     try {
-        allAdminTicketsCache = await getAllAdminSupportTickets(); 
-        renderAllSupportTickets(allAdminTicketsCache);
+        if (!ticketsInfiniteScroll) {
+            ticketsInfiniteScroll = createInfiniteScroll(listEl, (page, append) => {
+                allAdminTicketsCache = append ? allAdminTicketsCache.concat(page.tickets) : page.tickets;
+                renderAllSupportTickets(page.tickets, append);
+            });
+        }
+        await ticketsInfiniteScroll.start(cursor => getAllAdminSupportTickets(cursor));
     } catch (error) {
         console.error("Error fetching admin support tickets:", error);
         if(listEl) listEl.innerHTML = `<p class="error-text col-span-full">Error loading tickets: ${error.message}</p>`;
@@ -49,13 +57,12 @@ export async function fetchAllAdminSupportTickets() {
     }
 }
 
-function renderAllSupportTickets(tickets) {
-    // ... (this function remains the same) ...
+function renderAllSupportTickets(tickets, append = false) {
     const listEl = allSupportTicketsListEl();
     if (!listEl) return;
-    listEl.innerHTML = '';
+    if (!append) listEl.innerHTML = '';
 
-    if (!tickets || tickets.length === 0) {
+    if (!append && (!tickets || tickets.length === 0)) {
         listEl.innerHTML = `<p class="placeholder-text col-span-full">No support tickets found.</p>`;
         return;
     }
@@ -107,20 +114,8 @@ function populateTicketDetailModal(ticketData) { // Helper function to populate
 
     const repliesContainer = ticketRepliesContainerEl();
     if (repliesContainer) {
-        repliesContainer.innerHTML = '';
-        if (ticketData.replies && ticketData.replies.length > 0) {
-            ticketData.replies.forEach(reply => {
-                const replyDiv = document.createElement('div');
-                replyDiv.className = `ticket-reply ${reply.author_role === 'admin' ? 'admin-reply' : 'client-reply'}`;
-                replyDiv.innerHTML = `
-                    <p class="ticket-reply-author">${reply.author_username} (${reply.author_role}) <span class="ticket-reply-timestamp">${formatDateDetailed(reply.timestamp)}</span></p>
-                    <p class="ticket-reply-message">${reply.message}</p>
-                `;
-                repliesContainer.appendChild(replyDiv);
-            });
-        } else {
-            repliesContainer.innerHTML = '<p class="placeholder-text text-sm">No replies yet.</p>';
-        }
+        repliesContainer.innerHTML = '<p class="placeholder-text text-sm">Loading replies...</p>';
+        loadTicketReplies(ticketData.id);
     }
 
     if (adminReplyTicketIdInputEl()) adminReplyTicketIdInputEl().value = ticketData.id;
@@ -130,6 +125,45 @@ function populateTicketDetailModal(ticketData) { // Helper function to populate
     updateTicketStatusButtons(ticketData.status);
 }
 
+function renderTicketReply(reply) {
+    const replyDiv = document.createElement('div');
+    replyDiv.className = `ticket-reply ${reply.author_role === 'admin' ? 'admin-reply' : 'client-reply'}`;
+    replyDiv.innerHTML = `
+        <p class="ticket-reply-author">${reply.author_username} (${reply.author_role}) <span class="ticket-reply-timestamp">${formatDateDetailed(reply.timestamp)}</span></p>
+        <p class="ticket-reply-message">${reply.message}</p>
+    `;
+    return replyDiv;
+}
+
+// Replies are paged by the API (oldest first); each "Load more" click appends the next page.
+async function loadTicketReplies(ticketId, cursor = null) {
+    const repliesContainer = ticketRepliesContainerEl();
+    if (!repliesContainer) return;
+    try {
+        const page = await getTicketRepliesAdmin(ticketId, cursor);
+        if (currentOpenTicketId === null || currentOpenTicketId.toString() !== ticketId.toString()) return; // Modal moved on
+        if (!cursor) repliesContainer.innerHTML = '';
+        repliesContainer.querySelector('.load-more-replies-button')?.remove();
+
+        if (!cursor && page.replies.length === 0) {
+            repliesContainer.innerHTML = '<p class="placeholder-text text-sm">No replies yet.</p>';
+            return;
+        }
+        page.replies.forEach(reply => repliesContainer.appendChild(renderTicketReply(reply)));
+
+        if (page.next_cursor) {
+            const loadMoreBtn = document.createElement('button');
+            loadMoreBtn.type = 'button';
+            loadMoreBtn.className = 'btn btn-sm btn-secondary load-more-replies-button mt-2';
+            loadMoreBtn.textContent = 'Load more replies';
+            loadMoreBtn.addEventListener('click', () => loadTicketReplies(ticketId, page.next_cursor));
+            repliesContainer.appendChild(loadMoreBtn);
+        }
+    } catch (error) {
+        console.error(`Error loading replies for ticket ${ticketId}:`, error);
+        repliesContainer.innerHTML = `<p class="error-text text-sm">Error loading replies: ${error.message}</p>`;
+    }
+}
 
 export async function openAdminTicketDetailModal(ticketId) {
     currentOpenTicketId = ticketId;
@@ -382,7 +382,7 @@ export function renderRequestCard(request, isOverviewCard = false) {
     return card;
 }
 
-export function showAdminNotesModal(requestId, requestType, action, currentNotes = '') {
+export function showAdminNotesModal(requestId, requestType, action, currentNotes = '', version = null) {
     const modal = getAdminPageElement('adminNotesModal');
     const modalTitle = getAdminPageElement('adminNotesModalTitle');
     const noteTextEl = getAdminPageElement('adminNoteText');
@@ -404,6 +404,8 @@ export function showAdminNotesModal(requestId, requestType, action, currentNotes
     requestIdEl.value = requestId;
     requestTypeEl.value = requestType;
     actionEl.value = action;
+    const versionEl = getAdminPageElement('adminNotesRequestVersion');
+    if (versionEl) versionEl.value = version ?? ''; // Sent back so the server answers 409 if the request changed meanwhile
     noteTextEl.value = currentNotes;
     modalTitle.textContent = `Notes for ${action.replace(/_/g, ' ')} (${requestType.replace(/_/g, ' ').replace('-', ' ')} ID: ${requestId})`;
 
@@ -114,6 +114,27 @@ export async function logoutUser() { // <<< NEWLY ADDED/ENSURED EXPORT
 }
 
 
+// --- Paginated Lists ---
+// Admin list endpoints are keyset-paginated: each response carries next_cursor (null on the last page).
+function listQuery(filters = {}, cursor = null) {
+    const params = new URLSearchParams(filters);
+    if (cursor) params.set('cursor', cursor);
+    const queryString = params.toString();
+    return queryString ? `?${queryString}` : '';
+}
+
+// Walks every page of a paginated list; only for views that genuinely need the full set (e.g. dropdowns).
+export async function fetchAllPages(fetchPage, itemsKey) {
+    const items = [];
+    let cursor = null;
+    do {
+        const page = await fetchPage(cursor);
+        items.push(...(page[itemsKey] || []));
+        cursor = page.next_cursor;
+    } while (cursor);
+    return items;
+}
+
 // --- Dashboard ---
 export async function getAdminDashboardSummary() {
     return fetchAdminAPI('/dashboard-summary');
@@ -123,18 +144,18 @@ export async function getRecentPendingOverview() {
 }
 
 // --- Pending Requests ---
-export async function getPendingRequests(requestCategory) {
-    return fetchAdminAPI(`/requests/${requestCategory}/pending`);
+export async function getPendingRequests(requestCategory, cursor = null) {
+    return fetchAdminAPI(`/requests/${requestCategory}/pending${listQuery({}, cursor)}`);
 }
 
-export async function getAllAdminSupportTickets() { // Corrected name
-    return fetchAdminAPI('/requests/support-tickets/all');
+export async function getAllAdminSupportTickets(cursor = null) { // Corrected name
+    return fetchAdminAPI(`/requests/support-tickets/all${listQuery({}, cursor)}`);
 }
 
 
 // --- Client Management ---
-export async function getAllClientsAdmin() {
-    return fetchAdminAPI('/clients');
+export async function getAllClientsAdmin(cursor = null) {
+    return fetchAdminAPI(`/clients${listQuery({}, cursor)}`);
 }
 export async function createClientAdmin(clientData) {
     return fetchAdminAPI('/clients/create', 'POST', clientData);
@@ -150,9 +171,8 @@ export async function getClientDetailsAdmin(clientId) {
 }
 
 // --- Domain Management ---
-export async function getAllAdminDomains(filters = {}) {
-    const queryParams = new URLSearchParams(filters).toString();
-    return fetchAdminAPI(`/all-domains${queryParams ? '?' + queryParams : ''}`);
+export async function getAllAdminDomains(filters = {}, cursor = null) {
+    return fetchAdminAPI(`/all-domains${listQuery(filters, cursor)}`);
 }
 export async function getDomainDetailsAdmin(domainId) {
     return fetchAdminAPI(`/domain/${domainId}/details`);
@@ -190,11 +210,19 @@ export async function updateRequestStatusAdmin(requestType, requestId, status, a
     return fetchAdminAPI(`/requests/${endpointPath}/${requestId}/status`, 'PUT', payload);
 }
 
+/**
+ * Applies several status decisions in one transaction; each item succeeds or fails on its own.
+ * @param {Array<{request_id: number, status: string, admin_notes?: string}>} items
+ * @returns {Promise<{message: string, results: {success: Array, errors: Array}}>}
+ */
+export async function batchUpdateRequestStatusAdmin(items) {
+    return fetchAdminAPI('/requests/batch-status', 'POST', { items });
+}
+
 
 // --- Invoice Management ---
-export async function getAllAdminInvoices(filters = {}) { // Corrected name
-    const queryParams = new URLSearchParams(filters).toString();
-    return fetchAdminAPI(`/invoices${queryParams ? '?' + queryParams : ''}`);
+export async function getAllAdminInvoices(filters = {}, cursor = null) { // Corrected name
+    return fetchAdminAPI(`/invoices${listQuery(filters, cursor)}`);
 }
 
 export async function createInvoiceAdmin(invoiceData) {
@@ -217,6 +245,10 @@ export async function cancelInvoiceAdmin(invoiceId) {
 export async function adminReplyToTicket(ticketId, message) { // Corrected name
     return fetchAdminAPI(`/support-tickets/${ticketId}/reply`, 'POST', { message });
 }
+export async function getTicketRepliesAdmin(ticketId, cursor = null) {
+    const queryParams = cursor ? `?cursor=${cursor}` : '';
+    return fetchAdminAPI(`/support-tickets/${ticketId}/replies${queryParams}`);
+}
 // --- Support Ticket Details (Admin) ---
 export async function getAdminTicketDetails(ticketId) {
     // Assuming your backend has a route like GET /api/admin/support-tickets/<ticket_id>/details
@@ -108,6 +108,10 @@ export async function fetchDomainSuggestions(keywords) {
     const queryParams = new URLSearchParams({ keywords: keywords }).toString();
     return fetchClientAPI(`${C_API.API_BASE_URL}/domain-suggestions?${queryParams}`);
 }
+export async function fetchSuggestionAvailability(names) {
+    const queryParams = new URLSearchParams({ names: names.join(',') }).toString();
+    return fetchClientAPI(`${C_API.API_BASE_URL}/domain-suggestions/availability?${queryParams}`);
+}
 
 
 // --- Profile ---
@@ -122,6 +126,10 @@ export async function submitNewTicket(ticketData) {
 export async function submitTicketReply(ticketId, message) {
     return fetchClientAPI(`${C_API.SUPPORT_TICKETS_URL}/${ticketId}/reply`, { method: 'POST', body: JSON.stringify({ message }) });
 }
+export async function fetchTicketReplies(ticketId, cursor = null) {
+    const queryParams = cursor ? `?${new URLSearchParams({ cursor }).toString()}` : '';
+    return fetchClientAPI(`${C_API.SUPPORT_TICKETS_URL}/${ticketId}/replies${queryParams}`);
+}
 
 // --- Billing ---
 export async function submitPaymentProof(invoiceId, notes) {
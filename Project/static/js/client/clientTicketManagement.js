@@ -165,47 +165,66 @@ export function openClientTicketDetailModal(ticketId) {
     if(clientTicketInitialMessageDisplayPEl()) clientTicketInitialMessageDisplayPEl().textContent = ticket.message;
 
     const repliesContainer = clientTicketRepliesContainerDivEl();
+    if (repliesContainer) {
+        repliesContainer.innerHTML = '<p class="placeholder-text">Loading replies...</p>';
+        loadClientTicketReplies(ticket.id);
+    }
+    openModal(modal);
+}
+
+function renderClientTicketReply(reply, currentUser) {
+    const replyDiv = document.createElement('div');
+    const isClientReplyByCurrentUser = reply.author_role === 'client' && currentUser && reply.author_username === currentUser.username;
+    const isAdminReply = reply.author_role === 'admin';
+
+    replyDiv.className = `client-ticket-reply ${isClientReplyByCurrentUser ? 'client-reply' : (isAdminReply ? 'admin-reply' : 'other-client-reply')}`;
+
+    let authorText = reply.author_username;
+    if (isClientReplyByCurrentUser) authorText = 'You';
+    else if (isAdminReply) authorText = reply.author_username || 'Support Team';
+
+    // Client's own messages on the right, admin/other messages on the left
+    const flexClass = isClientReplyByCurrentUser ? 'flex-row-reverse' : '';
+
+    replyDiv.innerHTML = `
+        <div class="flex justify-between items-center ${flexClass}">
+            <span class="client-ticket-reply-author">${authorText}</span>
+            <span class="client-ticket-reply-timestamp">${formatDateDetailed(reply.timestamp)}</span> </div>
+        <p class="client-ticket-reply-message mt-1 ${isClientReplyByCurrentUser ? 'text-right' : 'text-left'}">${reply.message}</p>
+    `;
+    return replyDiv;
+}
+
+// Replies are paged by the API (oldest first); "Load more" appends the next page.
+async function loadClientTicketReplies(ticketId, cursor = null) {
+    const repliesContainer = clientTicketRepliesContainerDivEl();
+    if (!repliesContainer) return;
     const currentUser = getCurrentUserData(); // Get current user for author display
+    try {
+        const page = await API.fetchTicketReplies(ticketId, cursor);
+        if (clientReplyTicketIdInputEl() && clientReplyTicketIdInputEl().value !== ticketId.toString()) return; // Modal moved on
+        if (!cursor) repliesContainer.innerHTML = '';
+        repliesContainer.querySelector('.load-more-replies-button')?.remove();
 
-    if (repliesContainer) {
-        repliesContainer.innerHTML = ''; // Clear previous
-        if (ticket.replies && ticket.replies.length > 0) {
-            ticket.replies.forEach(reply => {
-                const replyDiv = document.createElement('div');
-                const isClientReplyByCurrentUser = reply.author_role === 'client' && currentUser && reply.author_username === currentUser.username;
-                const isAdminReply = reply.author_role === 'admin';
-
-                replyDiv.className = `client-ticket-reply ${isClientReplyByCurrentUser ? 'client-reply' : (isAdminReply ? 'admin-reply' : 'other-client-reply')}`;
-                // ^^^ You might need more specific CSS for 'other-client-reply' if it's possible and needs different styling.
-                // Your original CSS only had .client-reply and .admin-reply.
-
-                let authorText = reply.author_username;
-                if (isClientReplyByCurrentUser) authorText = 'You';
-                else if (isAdminReply) authorText = reply.author_username || 'Support Team';
-
-
-                // Adjust flex direction for alignment
-                let flexClass = '';
-                if (isClientReplyByCurrentUser) {
-                    flexClass = 'flex-row-reverse'; // Client's own messages on the right
-                } else {
-                    flexClass = ''; // Admin/other messages on the left
-                }
-
-                replyDiv.innerHTML = `
-                    <div class="flex justify-between items-center ${flexClass}">
-                        <span class="client-ticket-reply-author">${authorText}</span>
-                        <span class="client-ticket-reply-timestamp">${formatDateDetailed(reply.timestamp)}</span> </div>
-                    <p class="client-ticket-reply-message mt-1 ${isClientReplyByCurrentUser ? 'text-right' : 'text-left'}">${reply.message}</p>
-                `;
-                repliesContainer.appendChild(replyDiv);
-            });
-            repliesContainer.scrollTop = repliesContainer.scrollHeight;
-        } else {
+        if (!cursor && page.replies.length === 0) {
             repliesContainer.innerHTML = '<p class="placeholder-text">No replies yet.</p>';
+            return;
         }
+        page.replies.forEach(reply => repliesContainer.appendChild(renderClientTicketReply(reply, currentUser)));
+
+        if (page.next_cursor) {
+            const loadMoreBtn = document.createElement('button');
+            loadMoreBtn.type = 'button';
+            loadMoreBtn.className = 'btn btn-sm btn-secondary load-more-replies-button mt-2';
+            loadMoreBtn.textContent = 'Load more replies';
+            loadMoreBtn.addEventListener('click', () => loadClientTicketReplies(ticketId, page.next_cursor));
+            repliesContainer.appendChild(loadMoreBtn);
+        } else if (!cursor) {
+            repliesContainer.scrollTop = repliesContainer.scrollHeight;
+        }
+    } catch (error) {
+        repliesContainer.innerHTML = `<p class="placeholder-text">Error loading replies: ${error.message}</p>`;
     }
-    openModal(modal);
 }
 
 async function handleTicketReplySubmit(event) {
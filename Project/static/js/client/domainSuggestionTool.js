@@ -2,7 +2,7 @@
 import { openModal, closeModal, resetModalForm, initializeModalCloseEvents } from '../common/modalUtils.js';
 import { showMessage } from '../common/messageBox.js';
 import { createClientIcon } from './clientUI.js'; // Assuming clientUI re-exports createIcon
-import { fetchDomainSuggestions } from './apiClientService.js'; // Import the actual API service function
+import { fetchDomainSuggestions, fetchSuggestionAvailability } from './apiClientService.js'; // Import the actual API service function
 import { openRegisterDomainModal } from './clientRequestModals.js'; // For the "Register" button
 
 // DOM Elements for Domain Suggestion Tool Modal
@@ -13,6 +13,10 @@ const keywordsErrorEl = () => document.getElementById('domainKeywordsError');
 const suggestionsListEl = () => document.getElementById('domain-suggestions-list');
 const suggestionLoadingEl = () => document.getElementById('domain-suggestion-loading');
 
+const PENDING_POLL_INTERVAL = 1500; // ms between follow-up checks for names the registrar hadn't answered yet
+const PENDING_POLL_ATTEMPTS = 8;
+let suggestionSearchGeneration = 0; // Bumped per search so stale follow-ups don't overwrite newer results
+
 export function initializeDomainSuggestionTool() {
     const openButton = document.getElementById('open-domain-suggestion-tool-button');
     const modal = suggestionToolModalEl();
@@ -83,11 +87,13 @@ async function handleDomainSuggestionSubmit(event) {
 
     suggestionsList.innerHTML = ''; 
     loadingIndicator.classList.remove('hidden');
+    const generation = ++suggestionSearchGeneration;
 
     try {
         const response = await fetchDomainSuggestions(keywords); // Use actual API call
         if (response && response.suggestions) {
             renderSuggestions(response.suggestions);
+            if (response.pending && response.pending.length) pollPendingSuggestions(response.suggestions, response.pending, generation);
         } else if (response && response.error) {
             showMessage(`Error fetching suggestions: ${response.error}`, "error");
             suggestionsList.innerHTML = `<p class="text-sm text-red-400">Error: ${response.error}</p>`;
@@ -103,6 +109,30 @@ async function handleDomainSuggestionSubmit(event) {
     }
 }
 
+/**
+ * Re-checks names the registrar hadn't answered within the server's deadline and
+ * merges the late answers into the rendered list.
+ */
+async function pollPendingSuggestions(suggestions, pendingNames, generation) {
+    let pending = pendingNames;
+    for (let attempt = 0; attempt < PENDING_POLL_ATTEMPTS && pending.length; attempt++) {
+        await new Promise(resolve => setTimeout(resolve, PENDING_POLL_INTERVAL));
+        if (generation !== suggestionSearchGeneration) return; // A newer search replaced the list
+        try {
+            const response = await fetchSuggestionAvailability(pending);
+            if (generation !== suggestionSearchGeneration) return;
+            const updates = new Map(response.suggestions.map(s => [s.name, s]));
+            suggestions = suggestions.map(s => updates.get(s.name) || s);
+            suggestions.sort((a, b) => (a.available === b.available ? a.name.localeCompare(b.name) : (a.available ? -1 : 1)));
+            renderSuggestions(suggestions);
+            pending = response.pending || [];
+        } catch (error) {
+            console.warn("Domain suggestions: follow-up availability check failed.", error);
+            return;
+        }
+    }
+}
+
 function renderSuggestions(suggestions) {
     const suggestionsList = suggestionsListEl();
     if (!suggestionsList) return;
@@ -130,8 +160,9 @@ function renderSuggestions(suggestions) {
         priceSpan.textContent = suggestion.price; // Price from backend
         
         const statusSpan = document.createElement('span');
-        statusSpan.className = `text-xs font-semibold px-2 py-1 rounded-full ${suggestion.available ? 'bg-green-500 text-green-100' : 'bg-red-500 text-red-100'}`;
-        statusSpan.textContent = suggestion.available ? 'Available' : 'Taken (Locally)';
+        const statusClass = suggestion.available ? 'bg-green-500 text-green-100' : (suggestion.pending ? 'bg-yellow-500 text-yellow-100' : 'bg-red-500 text-red-100');
+        statusSpan.className = `text-xs font-semibold px-2 py-1 rounded-full ${statusClass}`;
+        statusSpan.textContent = suggestion.available ? 'Available' : (suggestion.status_detail || 'Taken (Locally)');
 
         const actionButton = document.createElement('button');
         actionButton.className = `btn btn-xs ${suggestion.available ? 'btn-primary' : 'btn-secondary disabled:opacity-50'}`;
@@ -0,0 +1,73 @@
+// Project/static/js/common/infiniteScroll.js
+
+/**
+ * Drives a keyset-paginated list ({ ..., next_cursor }) as an infinite scroll.
+ * A sentinel is placed after `anchorElement`; whenever it scrolls into view and the
+ * last page returned a next_cursor, the next page is fetched and handed to renderPage.
+ * @param {HTMLElement} anchorElement - The list/table element the sentinel follows.
+ * @param {function(object, boolean): void} renderPage - Called with (page, append).
+ * @returns {{ start: function(function(?string): Promise<object>): Promise<?object> }}
+ */
+export function createInfiniteScroll(anchorElement, renderPage) {
+    let fetchPage = null;
+    let nextCursor = null;
+    let loading = false;
+    let generation = 0; // Bumped by start() so responses for a superseded list are dropped
+
+    const sentinel = document.createElement('div');
+    sentinel.className = 'infinite-scroll-sentinel';
+    sentinel.setAttribute('aria-hidden', 'true');
+    anchorElement.insertAdjacentElement('afterend', sentinel);
+
+    const observer = new IntersectionObserver((entries) => {
+        if (entries.some(entry => entry.isIntersecting)) loadNextPage();
+    }, { rootMargin: '200px' });
+
+    // Re-observing makes the observer report the sentinel's current state, so a short
+    // page that leaves the sentinel on screen immediately pulls the following page.
+    function rearm() {
+        observer.unobserve(sentinel);
+        if (nextCursor) observer.observe(sentinel);
+    }
+
+    async function loadNextPage() {
+        if (!nextCursor || loading || !fetchPage) return;
+        const currentGeneration = generation;
+        loading = true;
+        try {
+            const page = await fetchPage(nextCursor);
+            if (currentGeneration !== generation) return;
+            nextCursor = page.next_cursor;
+            renderPage(page, true);
+        } catch (error) {
+            console.error("Infinite scroll: failed to load next page.", error);
+            if (currentGeneration === generation) nextCursor = null; // Stop retrying a failing cursor
+        } finally {
+            if (currentGeneration === generation) {
+                loading = false;
+                rearm();
+            }
+        }
+    }
+
+    return {
+        /**
+         * Loads the first page with a new fetcher (e.g. after filters change), replacing the list.
+         * Errors propagate to the caller. Resolves to the first page, or null if superseded.
+         */
+        async start(newFetchPage) {
+            generation += 1;
+            const currentGeneration = generation;
+            fetchPage = newFetchPage;
+            nextCursor = null;
+            loading = false;
+            observer.unobserve(sentinel);
+            const page = await fetchPage(null);
+            if (currentGeneration !== generation) return null;
+            nextCursor = page.next_cursor;
+            renderPage(page, false);
+            rearm();
+            return page;
+        }
+    };
+}
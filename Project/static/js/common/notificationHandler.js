@@ -7,7 +7,10 @@ import { formatSimpleDate } from './dateUtils.js'; // Assuming dateUtils.js is i
 const API_BASE_URL = '/api'; // General API base
 const NOTIFICATIONS_API_URL = `${API_BASE_URL}/notifications`;
 const MARK_READ_API_URL = `${API_BASE_URL}/notifications/mark-read`;
-const POLLING_INTERVAL = 30000; // 30 seconds for polling new notifications
+const STREAM_API_URL = `${API_BASE_URL}/notifications/stream`;
+const POLLING_INTERVAL = 30000; // 30 seconds for polling new notifications (fallback when the stream is unavailable)
+const NOTIFICATION_LIST_LIMIT = 20; // Matches the server's /notifications page size
+const MAX_STREAM_FAILURES = 3; // Consecutive connection errors before falling back to polling
 
 // --- State ---
 let notificationBellButton = null;
@@ -19,6 +22,8 @@ let viewAllNotificationsLink = null; // For future use
 
 let isPanelOpen = false;
 let notificationPollingIntervalId = null;
+let notificationEventSource = null;
+let streamFailures = 0;
 let currentUnreadCount = 0;
 
 /**
@@ -75,7 +80,7 @@ export function initializeNotificationSystem(
     });
 
     fetchNotifications(); // Initial fetch
-    startNotificationPolling();
+    startNotificationStream();
 
     console.log(`Notification system initialized for ${bellButtonId.startsWith('admin-') ? 'Admin' : 'Client'} Panel.`);
 }
@@ -138,53 +143,61 @@ function renderNotifications(notifications) {
         return;
     }
 
-    notifications.forEach(notification => {
-        const li = document.createElement('li');
-        li.className = `p-3 hover:bg-gray-700 cursor-pointer ${notification.is_read ? 'opacity-70' : 'font-semibold'}`;
-        li.dataset.notificationId = notification.id;
-        li.addEventListener('click', () => handleNotificationClick(notification));
-
-        let iconName = 'Info';
-        let iconColor = 'text-sky-400'; // Default
-
-        // Determine icon and color based on notification_type
-        if (notification.notification_type) {
-            if (notification.notification_type.includes('ticket_reply') || notification.notification_type.includes('ticket_status')) {
-                iconName = 'MessageSquare';
-                iconColor = 'text-purple-400';
-            } else if (notification.notification_type.includes('invoice')) {
-                iconName = 'FileText';
-                iconColor = 'text-green-400';
-            } else if (notification.notification_type.includes('domain_expiry')) {
-                iconName = 'CalendarClock';
-                iconColor = 'text-yellow-400';
-            } else if (notification.notification_type.includes('request_update') || notification.notification_type.includes('new_request')) {
-                iconName = 'BellRing'; // Or specific icons per request type
-                iconColor = 'text-indigo-400';
-                if (notification.message.toLowerCase().includes('approved') || notification.message.toLowerCase().includes('completed')) {
-                    iconName = 'CheckCircle2'; iconColor = 'text-green-400';
-                } else if (notification.message.toLowerCase().includes('rejected') || notification.message.toLowerCase().includes('failed')) {
-                    iconName = 'XCircle'; iconColor = 'text-red-400';
-                }
+    notifications.forEach(notification => appendNotificationItem(notification));
+    refreshLucideIcons(); // Ensure newly added icons are rendered
+}
+
+/**
+ * Adds one notification to the dropdown list.
+ * @param {object} notification - Notification object.
+ * @param {boolean} [prepend=false] - Insert at the top (newest first) instead of the bottom.
+ */
+function appendNotificationItem(notification, prepend = false) {
+    const li = document.createElement('li');
+    li.className = `p-3 hover:bg-gray-700 cursor-pointer ${notification.is_read ? 'opacity-70' : 'font-semibold'}`;
+    li.dataset.notificationId = notification.id;
+    li.addEventListener('click', () => handleNotificationClick(notification));
+
+    let iconName = 'Info';
+    let iconColor = 'text-sky-400'; // Default
+
+    // Determine icon and color based on notification_type
+    if (notification.notification_type) {
+        if (notification.notification_type.includes('ticket_reply') || notification.notification_type.includes('ticket_status')) {
+            iconName = 'MessageSquare';
+            iconColor = 'text-purple-400';
+        } else if (notification.notification_type.includes('invoice')) {
+            iconName = 'FileText';
+            iconColor = 'text-green-400';
+        } else if (notification.notification_type.includes('domain_expiry')) {
+            iconName = 'CalendarClock';
+            iconColor = 'text-yellow-400';
+        } else if (notification.notification_type.includes('request_update') || notification.notification_type.includes('new_request')) {
+            iconName = 'BellRing'; // Or specific icons per request type
+            iconColor = 'text-indigo-400';
+            if (notification.message.toLowerCase().includes('approved') || notification.message.toLowerCase().includes('completed')) {
+                iconName = 'CheckCircle2'; iconColor = 'text-green-400';
+            } else if (notification.message.toLowerCase().includes('rejected') || notification.message.toLowerCase().includes('failed')) {
+                iconName = 'XCircle'; iconColor = 'text-red-400';
             }
         }
+    }
 
 
-        const iconContainerId = `notif-icon-${notification.id}`;
+    const iconContainerId = `notif-icon-${notification.id}`;
 
-        li.innerHTML = `
-            <div class="flex items-start space-x-3">
-                <span id="${iconContainerId}" class="mt-1 flex-shrink-0 ${iconColor}"></span>
-                <div>
-                    <p class="text-sm ${notification.is_read ? 'text-gray-400' : 'text-gray-100'}">${notification.message}</p>
-                    <p class="text-xs text-gray-500">${formatSimpleDate(notification.timestamp)}</p>
-                </div>
+    li.innerHTML = `
+        <div class="flex items-start space-x-3">
+            <span id="${iconContainerId}" class="mt-1 flex-shrink-0 ${iconColor}"></span>
+            <div>
+                <p class="text-sm ${notification.is_read ? 'text-gray-400' : 'text-gray-100'}">${notification.message}</p>
+                <p class="text-xs text-gray-500">${formatSimpleDate(notification.timestamp)}</p>
             </div>
-        `;
-        notificationItemsList.appendChild(li);
-        createIcon(iconContainerId, iconName, { class: 'h-4 w-4' });
-    });
-    refreshLucideIcons(); // Ensure newly added icons are rendered
+        </div>
+    `;
+    if (prepend) notificationItemsList.prepend(li);
+    else notificationItemsList.appendChild(li);
+    createIcon(iconContainerId, iconName, { class: 'h-4 w-4' });
 }
 
 /**
@@ -271,6 +284,52 @@ async function handleMarkAllRead() {
     }
 }
 
+/**
+ * Subscribes to the server-sent notification stream. The browser resumes with
+ * Last-Event-ID after a dropped connection; polling is only used if streaming
+ * is unsupported or keeps failing.
+ */
+function startNotificationStream() {
+    if (!window.EventSource) {
+        startNotificationPolling();
+        return;
+    }
+    stopNotificationStream();
+    notificationEventSource = new EventSource(STREAM_API_URL, { withCredentials: true });
+
+    notificationEventSource.addEventListener('open', () => { streamFailures = 0; });
+    notificationEventSource.addEventListener('unread_count', (event) => {
+        updateUnreadCount(JSON.parse(event.data).unread_count);
+    });
+    notificationEventSource.addEventListener('notification', (event) => {
+        const notification = JSON.parse(event.data);
+        if (!notificationItemsList || notificationItemsList.querySelector(`li[data-notification-id="${notification.id}"]`)) return;
+        if (!notificationItemsList.querySelector('li[data-notification-id]')) notificationItemsList.innerHTML = ''; // Drop the "No new notifications" placeholder
+        appendNotificationItem(notification, true);
+        while (notificationItemsList.children.length > NOTIFICATION_LIST_LIMIT) notificationItemsList.lastElementChild.remove();
+        refreshLucideIcons();
+    });
+    notificationEventSource.addEventListener('error', () => {
+        streamFailures += 1;
+        // CLOSED means the browser gave up (e.g. logged out, or a 503 when the server is at its stream cap); otherwise it is already retrying
+        if (notificationEventSource.readyState === EventSource.CLOSED || streamFailures >= MAX_STREAM_FAILURES) {
+            console.warn("NotificationHandler: Notification stream unavailable, falling back to polling.");
+            stopNotificationStream();
+            startNotificationPolling();
+        }
+    });
+}
+
+/**
+ * Closes the notification stream, if open.
+ */
+function stopNotificationStream() {
+    if (notificationEventSource) {
+        notificationEventSource.close();
+        notificationEventSource = null;
+    }
+}
+
 /**
  * Starts polling for new notifications.
  */
@@ -306,4 +365,7 @@ export function stopNotificationPolling() {
 }
 
 // Cleanup on page unload (optional, good practice)
-window.addEventListener('beforeunload', stopNotificationPolling);
+window.addEventListener('beforeunload', () => {
+    stopNotificationStream();
+    stopNotificationPolling();
+});
@@ -0,0 +1,119 @@
+"""Shared fixtures. The suite runs against DATABASE_URL when it is set (e.g. a scratch PostgreSQL database) and
+against a throwaway SQLite file otherwise; every test starts from freshly created tables.
+
+    python -m pytest Project/tests                                                   # SQLite
+    DATABASE_URL=postgresql+psycopg2://user@host/scratch python -m pytest Project/tests  # PostgreSQL
+
+test_backends.py additionally runs the dialect-specific paths against every backend in the matrix
+(SQLite plus TEST_POSTGRES_URL when set) inside a single run.
+"""
+import datetime
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+_tmpdir = tempfile.mkdtemp(prefix='domainhub-tests-')
+os.environ.setdefault('DATABASE_URL', 'sqlite:///' + os.path.join(_tmpdir, 'test.db'))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+from app import app as flask_app, db, User, Domain, DomainRequest, Invoice  # noqa: E402
+
+flask_app.config.update(TESTING=True, WTF_CSRF_ENABLED=False)
+flask_app.extensions['mail'].suppress = True
+
+
+def _reset_database():
+    db.session.remove()
+    db.drop_all()
+    if db.engine.dialect.name == 'sqlite':
+        for index_name in ('domain_search', 'invoice_search'):
+            db.session.execute(db.text(f"DROP TABLE IF EXISTS {index_name}"))
+        db.session.commit()
+    db.create_all()
+    app_module.ensure_search_index()
+    app_module.taken_name_index.invalidate()
+    app_module.registrar.cache.entries.clear()
+
+
+@pytest.fixture
+def app():
+    """The Flask app over freshly created tables. No app context is left pushed, so each test-client request gets its
+    own (as in production); wrap direct database work in `with app.app_context():`."""
+    with flask_app.app_context():
+        _reset_database()
+    yield flask_app
+
+
+@pytest.fixture
+def users(app):
+    """{'admin'|'client1'|'client2': user id}, all with password 'pw'."""
+    with app.app_context():
+        created = {}
+        for username, role in (('admin', 'admin'), ('client1', 'client'), ('client2', 'client')):
+            user = User(username=username, name=username.title(), role=role, email=f'{username}@example.com')
+            user.set_password('pw')
+            created[username] = user
+        db.session.add_all(created.values())
+        db.session.commit()
+        return {username: user.id for username, user in created.items()}
+
+
+@pytest.fixture
+def login(app, users):
+    """login('client1') -> a test client with that user's session."""
+    def make(username):
+        client = app.test_client()
+        response = client.post('/login', data={'username': username, 'password': 'pw'})
+        assert response.status_code in (200, 302)
+        return client
+    return make
+
+
+@pytest.fixture
+def client_domains(app, users):
+    """Ids of three domains owned by client1, with an invoice for the first and a pending renew request for each."""
+    owner_id = users['client1']
+    today = datetime.date.today()
+    with app.app_context():
+        domains = [Domain(name=f'site{i}.com', user_id=owner_id, status='Active', expiry_date=today) for i in range(3)]
+        db.session.add_all(domains)
+        db.session.flush()
+        db.session.add(Invoice(invoice_number='INV-1', user_id=owner_id, domain_id=domains[0].id, description='Renewal', amount=12.5, due_date=today))
+        db.session.add_all([DomainRequest(user_id=owner_id, domain_id=d.id, domain_name=d.name, request_type='renew',
+                                          requested_data={'renewalDurationYears': 2}) for d in domains])
+        db.session.commit()
+        return [d.id for d in domains]
+
+
+class StatementCounter:
+    def __init__(self):
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def count(self):
+        return len(self.statements)
+
+
+@pytest.fixture
+def count_statements(app):
+    """with count_statements() as counter: ... -> counter.count statements sent to the database."""
+    with app.app_context():
+        engine = db.engine
+
+    @contextmanager
+    def counting():
+        counter = StatementCounter()
+        event.listen(engine, 'before_cursor_execute', counter)
+        try:
+            yield counter
+        finally:
+            event.remove(engine, 'before_cursor_execute', counter)
+    return counting
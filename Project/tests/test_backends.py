@@ -0,0 +1,95 @@
+"""The dialect-specific write paths (ON CONFLICT upserts, greatest(), version counters) against every backend in one run:
+SQLite always, PostgreSQL when TEST_POSTGRES_URL points at a scratch database (its tables are dropped and recreated).
+
+    TEST_POSTGRES_URL=postgresql+psycopg2://user@host/scratch python -m pytest Project/tests/test_backends.py
+"""
+import datetime
+import os
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+import app as app_module
+from app import db, User, Domain, DomainRequest, RequestCounter, NotificationCounter, BroadcastReadCursor, CacheVersion
+
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def engine(request, tmp_path):
+    if request.param == 'sqlite':
+        url = 'sqlite:///' + str(tmp_path / 'backend.db')
+    else:
+        url = os.environ.get('TEST_POSTGRES_URL')
+        if not url: pytest.skip('TEST_POSTGRES_URL not set')
+    engine = create_engine(url)
+    db.metadata.drop_all(engine)
+    db.metadata.create_all(engine)
+    yield engine
+    db.metadata.drop_all(engine)
+    engine.dispose()
+    app_module.taken_name_index.invalidate() # Its stamp was bumped in this database, not the app's
+
+
+@pytest.fixture
+def user_id(engine):
+    with Session(engine) as session:
+        user = User(username='client1', name='Client One', role='client', email='client1@example.com', password_hash='x')
+        session.add(user)
+        session.commit()
+        return user.id
+
+
+def test_request_counter_upserts(engine, user_id):
+    key = (user_id, 'renew', app_module.PENDING_APPROVAL_STATUS)
+    with engine.begin() as connection:
+        app_module._apply_request_counter_deltas(connection, {key: 2})
+        app_module._apply_request_counter_deltas(connection, {key: -1})
+    with Session(engine) as session:
+        session.add(DomainRequest(user_id=user_id, domain_name='site.com', request_type='renew', requested_data={}))
+        session.commit()
+        assert session.get(RequestCounter, key).count == 2
+
+
+def test_unread_counter_upserts(engine, user_id):
+    with engine.begin() as connection:
+        app_module._apply_unread_deltas(connection, {user_id: 3})
+        app_module._apply_unread_deltas(connection, {user_id: -2})
+    with Session(engine) as session:
+        assert session.get(NotificationCounter, user_id).unread_count == 1
+
+
+def test_broadcast_read_cursor_only_moves_forward(engine, user_id):
+    with engine.begin() as connection:
+        for read_through_id in (5, 3, 8):
+            app_module._upsert_broadcast_read_cursor(connection, user_id, read_through_id)
+    with engine.begin() as connection:
+        app_module._upsert_broadcast_read_cursor(connection, user_id, 7)
+    with Session(engine) as session:
+        assert session.get(BroadcastReadCursor, user_id).last_read_id == 8
+
+
+def test_taken_names_stamp_upsert_returns_the_new_version(engine, user_id):
+    for name in ('one.com', 'two.com'):
+        with Session(engine) as session:
+            session.add(Domain(name=name, user_id=user_id, status='Active', expiry_date=datetime.date.today()))
+            session.commit()
+    with Session(engine) as session:
+        assert session.get(CacheVersion, app_module.TakenNameIndex.VERSION_KEY).version == 2
+
+
+def test_concurrent_update_raises_stale_data(engine, user_id):
+    with Session(engine) as session:
+        domain = Domain(name='site.com', user_id=user_id, status='Active', expiry_date=datetime.date.today())
+        session.add(domain)
+        session.commit()
+        domain_id = domain.id
+    with Session(engine) as first, Session(engine) as second:
+        first.get(Domain, domain_id).auto_renew = True
+        second.get(Domain, domain_id).is_locked = False
+        first.commit()
+        with pytest.raises(StaleDataError):
+            second.commit()
+    with Session(engine) as session:
+        domain = session.get(Domain, domain_id)
+        assert (domain.auto_renew, domain.is_locked, domain.version) == (True, True, 2)
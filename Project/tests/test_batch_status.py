@@ -0,0 +1,51 @@
+import datetime
+
+import app as app_module
+from app import db, Domain, DomainRequest
+
+
+def request_ids(app):
+    with app.app_context():
+        return [req_id for (req_id,) in db.session.query(DomainRequest.id).order_by(DomainRequest.id)]
+
+
+def test_batch_is_rolled_back_as_a_whole(app, client_domains, login, monkeypatch):
+    def fail(notices):
+        raise RuntimeError('mail queue down')
+    monkeypatch.setattr(app_module, '_send_status_notices', fail)
+    with app.app_context():
+        expiry_before = {d.id: d.expiry_date for d in Domain.query}
+    items = [{'request_id': req_id, 'status': 'Approved'} for req_id in request_ids(app)]
+    response = login('admin').post('/api/admin/requests/batch-status', json={'items': items})
+    assert response.status_code == 500
+    with app.app_context():
+        assert {req.status for req in DomainRequest.query} == {app_module.PENDING_APPROVAL_STATUS}
+        assert {d.id: d.expiry_date for d in Domain.query} == expiry_before
+
+
+def test_second_approval_of_a_decided_request_is_refused(app, client_domains, login):
+    admin = login('admin')
+    req_id = request_ids(app)[0]
+    with app.app_context():
+        expiry_before = db.session.get(Domain, client_domains[0]).expiry_date
+    url = f'/api/admin/requests/renewals/{req_id}/status'
+    assert admin.put(url, json={'status': 'Approved'}).status_code == 200
+    response = admin.put(url, json={'status': 'Approved'}) # No version, as sent by older pages
+    assert response.status_code == 409
+    assert response.json['item']['status'] == 'Completed'
+    response = admin.post('/api/admin/requests/batch-status', json={'items': [{'request_id': req_id, 'status': 'Rejected'}]})
+    assert response.status_code == 207 and response.json['results']['errors'][0]['conflict']
+    with app.app_context():
+        assert db.session.get(Domain, client_domains[0]).expiry_date == expiry_before + datetime.timedelta(days=365 * 2)
+
+
+def test_stale_version_is_refused(app, client_domains, login):
+    admin = login('admin')
+    req_id = request_ids(app)[0]
+    with app.app_context():
+        version = db.session.get(DomainRequest, req_id).version
+        db.session.get(DomainRequest, req_id).admin_notes = 'Checked by someone else'
+        db.session.commit()
+    response = admin.put(f'/api/admin/requests/renewals/{req_id}/status', json={'status': 'Approved', 'version': version})
+    assert response.status_code == 409
+    assert response.json['item']['status'] == app_module.PENDING_APPROVAL_STATUS
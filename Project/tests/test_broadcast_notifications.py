@@ -0,0 +1,63 @@
+import app as app_module
+from app import db, User, BroadcastNotification
+
+
+def broadcast(app, message='New ticket'):
+    with app.app_context():
+        app_module.create_broadcast_notification('admin', message, notification_type='new_ticket_admin')
+        db.session.commit()
+        return db.session.query(db.func.max(BroadcastNotification.id)).scalar()
+
+
+def add_admin(app, username, **fields):
+    with app.app_context():
+        user = User(username=username, name=username.title(), role='admin', email=f'{username}@example.com', **fields)
+        user.set_password('pw')
+        db.session.add(user)
+        db.session.commit()
+        return user.id
+
+
+def test_made_up_broadcast_id_cannot_pre_read_future_broadcasts(app, login):
+    first_id = broadcast(app)
+    admin = login('admin')
+    response = admin.post('/api/notifications/mark-read', json={'ids': [f'b{first_id + 1000}']})
+    assert response.json['broadcast_last_read_id'] == first_id
+    broadcast(app, 'Later ticket')
+    assert admin.get('/api/notifications').json['unread_count'] == 1
+
+
+def test_new_admin_starts_with_existing_broadcasts_read(app, login):
+    broadcast(app)
+    broadcast(app)
+    add_admin(app, 'admin2')
+    feed = login('admin2').get('/api/notifications').json
+    assert feed['unread_count'] == 0
+    assert [item['is_read'] for item in feed['notifications']] == [True, True]
+    broadcast(app, 'After joining')
+    assert login('admin2').get('/api/notifications').json['unread_count'] == 1
+
+
+def test_promoted_user_starts_with_existing_broadcasts_read(app, users, login):
+    broadcast(app)
+    with app.app_context():
+        db.session.get(User, users['client2']).role = 'admin'
+        db.session.commit()
+    assert login('client2').get('/api/notifications').json['unread_count'] == 0
+
+
+def test_inactive_admin_gets_no_broadcasts(app, login):
+    admin2_id = add_admin(app, 'admin2')
+    admin2 = login('admin2')
+    with app.app_context():
+        db.session.get(User, admin2_id).is_active = False
+        db.session.commit()
+        assert app_module.broadcast_role(db.session.get(User, admin2_id)) is None
+    broadcast(app)
+    assert admin2.get('/api/notifications').status_code == 401
+    with app.app_context():
+        db.session.get(User, admin2_id).is_active = True # Reactivated: what was sent meanwhile stays unseen
+        db.session.commit()
+    assert login('admin2').get('/api/notifications').json['unread_count'] == 0
+    broadcast(app, 'After reactivation')
+    assert login('admin2').get('/api/notifications').json['unread_count'] == 1
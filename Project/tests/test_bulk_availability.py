@@ -0,0 +1,163 @@
+"""POST /api/domain-availability/bulk and the RegistrarClient.check_stream generator behind it: NDJSON lines in
+answer order (invalid, locally taken, cached, then registrar chunks), a bounded number of chunks in flight, and
+exactly one circuit-breaker outcome per stream however it ends."""
+import json
+import threading
+import time
+
+import pytest
+
+import app as app_module
+from test_registrar import FakeDomainAPI, registrar  # noqa: F401 (fixture)
+
+
+class RecordingDomainAPI(FakeDomainAPI):
+    """FakeDomainAPI that answers from `taken`, takes `delay` seconds per call and records calls and peak concurrency."""
+    def __init__(self, taken=(), delay=0.0, fail=False):
+        super().__init__(fail=fail)
+        self.taken, self.delay = set(taken), delay
+        self.calls, self.running, self.peak = [], 0, 0
+        self.lock = threading.Lock()
+
+    def check(self, names):
+        with self.lock:
+            self.calls.append(list(names))
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            return {name: name not in self.taken for name in super().check(names)}
+        finally:
+            with self.lock: self.running -= 1
+
+
+@pytest.fixture
+def bulk_registrar(monkeypatch, registrar):  # noqa: F811
+    """A configured RegistrarClient with a RecordingDomainAPI, installed as the app's registrar."""
+    for setting in ('NAMECHEAP_API_USER', 'NAMECHEAP_API_KEY', 'NAMECHEAP_CLIENT_IP'):
+        monkeypatch.setattr(app_module, setting, 'test')
+    registrar._api = RecordingDomainAPI(taken={'taken.net'})
+    monkeypatch.setattr(app_module, 'registrar', registrar)
+    return registrar
+
+
+def open_breaker(registrar):  # noqa: F811
+    for _ in range(registrar.breaker.failure_threshold):
+        registrar.breaker.record_failure('timeout')
+
+
+def post_bulk(client, names):
+    response = client.post('/api/domain-availability/bulk', json={'names': names})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    assert response.mimetype == 'application/x-ndjson'
+    *entries, summary = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert summary['done'] is True
+    return entries, summary
+
+
+def test_names_are_normalised_deduplicated_and_answered_in_order(app, client_domains, login, bulk_registrar):
+    bulk_registrar.cache.set_many({'cached.org': False})
+    entries, summary = post_bulk(login('client1'), [
+        ' Fresh.COM. ', 'fresh.com', 'bad name.com', 'nodot', 'SITE0.com', 'cached.org', 'taken.net', '   ', 'fresh.com.'])
+    assert [(e['name'], e['status_detail']) for e in entries] == [
+        ('bad name.com', 'Invalid Domain Name'), ('nodot', 'Invalid Domain Name'), # Invalid names first...
+        ('site0.com', 'Taken (Locally)'),                                        # ...then the local index...
+        ('cached.org', 'Taken (Registrar)'),                                     # ...then the cache...
+        ('fresh.com', 'Available'), ('taken.net', 'Taken (Registrar)'),          # ...then the registrar
+    ]
+    assert sorted(name for call in bulk_registrar._api.calls for name in call) == ['fresh.com', 'taken.net']
+    assert summary == {'done': True, 'total': 6, 'counts': {'Invalid Domain Name': 2, 'Taken (Locally)': 1, 'Taken (Registrar)': 2, 'Available': 1}}
+
+
+def test_locally_taken_names_never_reach_the_registrar(app, users, client_domains, login, bulk_registrar):
+    assert login('client2').post('/api/domain-requests/register', json={
+        'requestedDomainName': 'wanted', 'requestedTld': '.com', 'registrationDurationYears': 1}).status_code == 201
+    entries, summary = post_bulk(login('client1'), ['site1.com', 'wanted.com', 'site2.com'])
+    assert {e['name']: e['status_detail'] for e in entries} == dict.fromkeys(['site1.com', 'wanted.com', 'site2.com'], 'Taken (Locally)')
+    assert bulk_registrar._api.calls == []
+    assert summary['counts'] == {'Taken (Locally)': 3}
+
+
+def test_open_breaker_answers_from_the_cache_only(app, login, bulk_registrar):
+    bulk_registrar.cache.set_many({'cached.com': True})
+    open_breaker(bulk_registrar)
+    entries, summary = post_bulk(login('client1'), ['cached.com', 'other.com'])
+    assert [(e['name'], e['status_detail']) for e in entries] == [('cached.com', 'Available'), ('other.com', 'Availability Check Error')]
+    assert bulk_registrar._api.calls == []
+    assert summary['counts'] == {'Available': 1, 'Availability Check Error': 1}
+
+
+def test_bulk_availability_input_errors(app, login, bulk_registrar, monkeypatch):
+    client = login('client1')
+    for body in ({}, {'names': []}, {'names': 'a.com'}, {'names': ['a.com', 5]}):
+        assert client.post('/api/domain-availability/bulk', json=body).status_code == 400
+    monkeypatch.setattr(app_module, 'BULK_AVAILABILITY_MAX_NAMES', 2)
+    assert client.post('/api/domain-availability/bulk', json={'names': ['a.com', 'b.com', 'c.com']}).status_code == 400
+    assert client.post('/api/domain-availability/bulk', json={'names': ['a.com', 'A.com', 'b.com']}).status_code == 200 # Counted after dedupe
+
+
+def test_cached_batch_comes_before_any_registrar_call(bulk_registrar):
+    bulk_registrar.cache.set_many({'a.com': True, 'b.com': False})
+    stream = bulk_registrar.check_stream(['a.com', 'x.com', 'b.com', 'y.com'], chunk_size=1)
+    assert next(stream) == ({'a.com': True, 'b.com': False}, [])
+    assert bulk_registrar._api.calls == []
+    assert sorted(name for results, _ in stream for name in results) == ['x.com', 'y.com']
+    assert sorted(call for call, in bulk_registrar._api.calls) == ['x.com', 'y.com']
+
+
+def test_at_most_max_in_flight_chunks_run_at_once(bulk_registrar):
+    bulk_registrar._api.delay = 0.05
+    names = [f'name{i}.com' for i in range(12)]
+    batches = list(bulk_registrar.check_stream(names, chunk_size=2, max_in_flight=3))
+    assert len(bulk_registrar._api.calls) == len(batches) == 6
+    assert bulk_registrar._api.peak == 3 # The pool has more workers than that; the stream holds back the rest
+    assert {name: value for results, _ in batches for name, value in results.items()} == dict.fromkeys(names, True)
+
+
+def test_open_breaker_raises_after_the_cached_batch(bulk_registrar):
+    bulk_registrar.cache.set_many({'a.com': True})
+    open_breaker(bulk_registrar)
+    stream = bulk_registrar.check_stream(['a.com', 'b.com'])
+    assert next(stream) == ({'a.com': True}, [])
+    with pytest.raises(app_module.RegistrarUnavailable):
+        next(stream)
+    assert bulk_registrar._api.calls == []
+
+
+def half_open(registrar):  # noqa: F811
+    open_breaker(registrar)
+    registrar.breaker.opened_at -= registrar.breaker.reset_seconds # The reset period has passed: the next call probes
+
+
+def test_closing_the_stream_early_settles_the_probe(bulk_registrar):
+    breaker = bulk_registrar.breaker
+    half_open(bulk_registrar)
+    bulk_registrar.cache.set_many({'a.com': True})
+    stream = bulk_registrar.check_stream(['a.com', 'b.com', 'c.com'], chunk_size=1, max_in_flight=1)
+    next(stream) # Cached batch: the probe has not been claimed yet
+    stream.close()
+    assert (breaker.state, breaker.probe_in_flight) == ('open', False) # Still due for a probe
+
+    stream = bulk_registrar.check_stream(['b.com', 'c.com'], chunk_size=1, max_in_flight=1)
+    assert next(stream) == ({'b.com': True}, []) # Claims the probe, which has now been answered
+    assert breaker.probe_in_flight
+    stream.close() # The consumer went away before c.com
+    assert (breaker.state, breaker.probe_in_flight) == ('closed', False)
+
+
+def test_probe_without_an_outcome_is_released(bulk_registrar):
+    breaker = bulk_registrar.breaker
+    half_open(bulk_registrar)
+    bulk_registrar.executor.shutdown() # Submitting now raises before any chunk is answered
+    stream = bulk_registrar.check_stream(['a.com'])
+    with pytest.raises(RuntimeError):
+        next(stream)
+    assert (breaker.state, breaker.probe_in_flight) == ('half_open', False)
+    assert breaker.allow() # The next caller gets to probe
+
+
+def test_failed_probe_reopens_the_circuit(bulk_registrar):
+    half_open(bulk_registrar)
+    bulk_registrar._api.fail = True
+    assert list(bulk_registrar.check_stream(['a.com'])) == [({'a.com': None}, [])]
+    assert bulk_registrar.breaker.state == 'open' and not bulk_registrar.breaker.probe_in_flight
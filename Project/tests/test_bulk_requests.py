@@ -0,0 +1,110 @@
+"""Bulk client request endpoints: per-item results, 201 vs 207, and the rows written alongside the requests
+(one consolidated outbox email per batch, one notification per request unless a summary is asked for)."""
+import app as app_module
+from app import db, DomainRequest, EmailOutbox, Notification
+
+
+def written(app, user_id, request_type):
+    """(requests, notifications, outbox emails) of request_type for user_id, with the counters checked against them."""
+    with app.app_context():
+        assert app_module.verify_request_counters() and app_module.verify_notification_counters()
+        requests = DomainRequest.query.filter_by(user_id=user_id, request_type=request_type).order_by(DomainRequest.id).all()
+        notifications = Notification.query.filter_by(user_id=user_id, notification_type=f'{request_type}_submitted').all()
+        return ([(r.id, r.domain_name, r.requested_data) for r in requests], [(n.message, n.link) for n in notifications],
+                [(e.recipients, e.subject) for e in EmailOutbox.query])
+
+
+def test_bulk_renew_of_owned_domains(app, users, client_domains, login):
+    before, _, _ = written(app, users['client1'], 'renew') # The fixture's single renewals
+    response = login('client1').post('/api/domain-requests/bulk-renew', json={'domain_ids': client_domains + [client_domains[0]],
+                                                                              'renewal_duration_years': 3})
+    assert response.status_code == 201, response.get_data(as_text=True)
+    success = response.json['results']['success']
+    assert [item['domain_id'] for item in success] == client_domains # The repeated id is renewed once
+
+    requests, notifications, emails = written(app, users['client1'], 'renew')
+    requests = requests[len(before):]
+    assert [(req_id, name) for req_id, name, _ in requests] == [(item['request_id'], item['domain_name']) for item in success]
+    assert [data for _, _, data in requests] == [{'renewalDurationYears': 3}] * len(client_domains)
+    assert sorted(link for _, link in notifications) == sorted(f'#request-{req_id}' for req_id, _, _ in requests)
+    assert emails == [(['client1@example.com'], 'Bulk Domain Renewal Request Submitted')]
+
+
+def test_bulk_renew_reports_unowned_and_bad_ids(app, users, client_domains, login):
+    with app.app_context():
+        other = app_module.Domain(name='theirs.com', user_id=users['client2'], status='Active')
+        db.session.add(other)
+        db.session.commit()
+        other_id = other.id
+    before, _, _ = written(app, users['client1'], 'renew')
+    response = login('client1').post('/api/domain-requests/bulk-renew', json={'domain_ids': [client_domains[1], other_id, 'x', 999999, True]})
+    assert response.status_code == 207
+    assert [item['domain_id'] for item in response.json['results']['success']] == [client_domains[1]]
+    assert sorted(map(str, (error['domain_id'] for error in response.json['results']['errors']))) == sorted(map(str, [other_id, 'x', 999999, True]))
+
+    after, notifications, emails = written(app, users['client1'], 'renew')
+    assert len(after) == len(before) + 1 and len(notifications) == 1 and len(emails) == 1
+    assert written(app, users['client2'], 'renew')[0] == []
+
+
+def test_bulk_renew_with_nothing_owned_writes_nothing(app, users, client_domains, login):
+    response = login('client2').post('/api/domain-requests/bulk-renew', json={'domain_ids': client_domains})
+    assert response.status_code == 207 and response.json['results']['success'] == []
+    assert written(app, users['client2'], 'renew') == ([], [], [])
+
+
+def test_bulk_renew_summary_notification(app, users, client_domains, login):
+    response = login('client1').post('/api/domain-requests/bulk-renew', json={'domain_ids': client_domains, 'summary_notification': True})
+    assert response.status_code == 201
+    _, notifications, emails = written(app, users['client1'], 'renew')
+    assert [message for message, _ in notifications] == ['Renewal requests for 3 domain(s) submitted.']
+    assert len(emails) == 1
+
+
+def register_item(name, tld='.com', years=1, **extra):
+    return {'requestedDomainName': name, 'requestedTld': tld, 'registrationDurationYears': years, **extra}
+
+
+def test_bulk_register_of_free_names(app, users, login):
+    response = login('client1').post('/api/domain-requests/register/bulk', json={'domains': [
+        register_item('alpha'), register_item('Beta', '.NET', 2, requestSsl=True, sslDurationYears=1)]})
+    assert response.status_code == 201, response.get_data(as_text=True)
+    success = response.json['results']['success']
+    assert [(item['index'], item['domain_name']) for item in success] == [(0, 'alpha.com'), (1, 'beta.net')]
+
+    requests, notifications, emails = written(app, users['client1'], 'register')
+    assert sorted((req_id, name) for req_id, name, _ in requests) == sorted((item['request_id'], item['domain_name']) for item in success)
+    assert sorted(link for _, link in notifications) == sorted(f'#request-{item["request_id"]}' for item in success)
+    assert emails == [(['client1@example.com'], 'Bulk Domain Registration Request Submitted')]
+
+
+def test_bulk_register_reports_duplicates_and_taken_names(app, users, client_domains, login):
+    assert login('client2').post('/api/domain-requests/register', json=register_item('pending')).status_code == 201
+    with app.app_context():
+        db.session.query(EmailOutbox).delete()
+        db.session.commit()
+    response = login('client1').post('/api/domain-requests/register/bulk', json={'domains': [
+        register_item('fresh'),         # 0: accepted
+        register_item('FRESH'),         # 1: same name again
+        register_item('site0'),         # 2: already a registered domain
+        register_item('pending'),       # 3: another client's pending registration
+        register_item('bad name'),      # 4: invalid
+        {'requestedDomainName': 'x'},   # 5: missing fields
+        register_item('other', '.org'), # 6: accepted
+    ]})
+    assert response.status_code == 207
+    results = response.json['results']
+    assert [(item['index'], item['domain_name']) for item in results['success']] == [(0, 'fresh.com'), (6, 'other.org')]
+    assert [error['index'] for error in results['errors']] == [1, 2, 3, 4, 5]
+    assert results['errors'][0]['error'] == 'Duplicate in batch.'
+    assert 'unavailable' in results['errors'][1]['error'] and 'unavailable' in results['errors'][2]['error']
+
+    requests, notifications, emails = written(app, users['client1'], 'register')
+    assert sorted(name for _, name, _ in requests) == ['fresh.com', 'other.org']
+    assert len(notifications) == 2 and len(emails) == 1
+
+
+def test_bulk_register_with_nothing_accepted_writes_nothing(app, users, client_domains, login):
+    response = login('client1').post('/api/domain-requests/register/bulk', json={'domains': [register_item('site1'), {}]})
+    assert response.status_code == 207 and response.json['results']['success'] == []
+    assert written(app, users['client1'], 'register') == ([], [], [])
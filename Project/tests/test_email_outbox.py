@@ -0,0 +1,150 @@
+"""The email outbox: rows live and die with the triggering transaction, are claimed by one worker at a time, and
+failed sends back off exponentially until they are dead-lettered."""
+import datetime
+import smtplib
+
+import pytest
+
+import app as app_module
+from app import db, DomainRequest, EmailOutbox
+
+
+class RecordingConnection:
+    def __init__(self, error=None):
+        self.error = error
+        self.sent = []
+
+    def send(self, message):
+        if self.error: raise self.error
+        self.sent.append(message)
+
+
+def utcnow():
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) # As read back from the naive DateTime columns
+
+
+def add_outbox_rows(app, count):
+    with app.app_context():
+        rows = [EmailOutbox(recipients=[f'user{i}@example.com'], subject=f'Subject {i}', html_body='<p>Hi</p>') for i in range(count)]
+        db.session.add_all(rows)
+        db.session.commit()
+        return [row.id for row in rows]
+
+
+def make_due(app, outbox_id):
+    with app.app_context():
+        db.session.get(EmailOutbox, outbox_id).next_attempt_at = utcnow() - datetime.timedelta(seconds=1)
+        db.session.commit()
+
+
+def test_rolled_back_change_queues_no_email(app, users):
+    with app.test_request_context():
+        db.session.add(DomainRequest(user_id=users['client1'], domain_name='kept.com', request_type='register'))
+        assert app_module.send_system_email('client1@example.com', 'Kept', 'new_request_submitted_client_email')
+        db.session.commit()
+        db.session.add(DomainRequest(user_id=users['client1'], domain_name='dropped.com', request_type='register'))
+        assert app_module.send_system_email('client1@example.com', 'Dropped', 'new_request_submitted_client_email')
+        db.session.flush()
+        db.session.rollback()
+        assert [row.subject for row in EmailOutbox.query] == ['Kept']
+        assert [req.domain_name for req in DomainRequest.query] == ['kept.com']
+
+
+def test_claimed_rows_are_leased_to_one_worker(app):
+    outbox_ids = add_outbox_rows(app, 3)
+    with app.app_context():
+        now = datetime.datetime.now(datetime.timezone.utc)
+        claimed = app_module._claim_due_emails(now, 10)
+        assert [row.id for row in claimed] == outbox_ids
+        assert app_module._claim_due_emails(now, 10) == [] # A second worker finds nothing due
+        # A worker that died mid-send gives its rows back when the lease runs out
+        after_lease = now + datetime.timedelta(seconds=app_module.EMAIL_OUTBOX_CLAIM_SECONDS + 1)
+        assert [row.id for row in app_module._claim_due_emails(after_lease, 10)] == outbox_ids
+
+
+def test_two_workers_send_each_row_once(app):
+    add_outbox_rows(app, 4)
+    first, second = RecordingConnection(), RecordingConnection()
+    with app.app_context():
+        assert app_module.deliver_outbox_batch(limit=2, connection=first) == (2, 0)
+        assert app_module.deliver_outbox_batch(connection=second) == (2, 0)
+        assert app_module.deliver_outbox_batch(connection=first) == (0, 0)
+        assert sorted(m.subject for m in first.sent + second.sent) == [f'Subject {i}' for i in range(4)]
+        assert {row.status for row in EmailOutbox.query} == {'sent'}
+
+
+def test_failed_send_backs_off_exponentially(app):
+    (outbox_id,) = add_outbox_rows(app, 1)
+    failing = RecordingConnection(smtplib.SMTPRecipientsRefused({'user0@example.com': (550, b'No such user')}))
+    base = app_module.EMAIL_OUTBOX_BACKOFF_SECONDS
+    for attempt in (1, 2, 3):
+        make_due(app, outbox_id)
+        with app.app_context():
+            before = utcnow()
+            assert app_module.deliver_outbox_batch(connection=failing) == (0, 1)
+            row = db.session.get(EmailOutbox, outbox_id)
+            assert (row.status, row.attempts) == ('pending', attempt)
+            assert 'No such user' in row.last_error
+            delay = (row.next_attempt_at - before).total_seconds()
+            assert base * 2 ** (attempt - 1) <= delay < base * 2 ** (attempt - 1) + 5
+            assert app_module.deliver_outbox_batch(connection=failing) == (0, 0) # Not due again until the backoff passes
+
+
+def test_row_is_dead_lettered_after_max_attempts(app):
+    (outbox_id,) = add_outbox_rows(app, 1)
+    failing = RecordingConnection(smtplib.SMTPDataError(554, b'Message rejected'))
+    for _ in range(app_module.EMAIL_OUTBOX_MAX_ATTEMPTS):
+        make_due(app, outbox_id)
+        with app.app_context():
+            assert app_module.deliver_outbox_batch(connection=failing) == (0, 1)
+    make_due(app, outbox_id)
+    with app.app_context():
+        assert app_module.deliver_outbox_batch(connection=RecordingConnection()) == (0, 0)
+        row = db.session.get(EmailOutbox, outbox_id)
+        assert (row.status, row.attempts, row.sent_at) == ('dead', app_module.EMAIL_OUTBOX_MAX_ATTEMPTS, None)
+        assert 'Message rejected' in row.last_error
+
+
+class FakeSMTPSession:
+    def __init__(self, errors):
+        self.errors = errors
+        self.sent = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def send(self, message):
+        if self.errors: raise self.errors.pop(0)
+        self.sent.append(message.subject)
+
+
+def pooled_connection(monkeypatch, errors):
+    sessions = []
+    def connect():
+        sessions.append(FakeSMTPSession(errors))
+        return sessions[-1]
+    monkeypatch.setattr(app_module.mail, 'connect', connect)
+    return app_module.PooledMailConnection(), sessions
+
+
+def test_pooled_connection_reconnects_after_a_dropped_session(app, monkeypatch):
+    for error in (smtplib.SMTPServerDisconnected('idle timeout'), ConnectionResetError('reset'), TimeoutError('timed out')):
+        connection, sessions = pooled_connection(monkeypatch, [error])
+        with app.app_context():
+            connection.send(app_module.Message('Hello', recipients=['a@example.com'], html='<p>Hi</p>'))
+        assert len(sessions) == 2 and sessions[1].sent == ['Hello']
+
+
+def test_pooled_connection_does_not_resend_a_rejected_message(app, monkeypatch):
+    for error in (smtplib.SMTPRecipientsRefused({'a@example.com': (550, b'No such user')}), smtplib.SMTPDataError(554, b'Rejected'),
+                  smtplib.SMTPAuthenticationError(535, b'Bad credentials')):
+        connection, sessions = pooled_connection(monkeypatch, [error])
+        with app.app_context():
+            with pytest.raises(type(error)) as raised:
+                connection.send(app_module.Message('Hello', recipients=['a@example.com'], html='<p>Hi</p>'))
+        assert raised.value is error
+        assert len(sessions) == 1 and sessions[0].sent == []
+        assert connection.connection is sessions[0] # The session itself is fine; keep it for the next message
@@ -0,0 +1,106 @@
+"""List and detail endpoints load their rows' relationships eagerly: the statement count must not grow with the rows.
+Admin lists are keyset-paginated, and a cursor that did not come from next_cursor is refused with a 400."""
+import base64
+import datetime
+import json
+
+import pytest
+
+from app import db, User, Domain, DomainRequest, Invoice, SupportTicket, TicketReply
+
+
+def add_rows(app, client_id, start, count):
+    """count rows in each list for client1, plus as many again owned by new clients, so every row's related user,
+    domain and transfer target is a distinct object (identity-map hits would hide a per-row lazy load)."""
+    today = datetime.date.today()
+    with app.app_context():
+        for i in range(start, start + count):
+            other = User(username=f'owner{i}', name=f'Owner {i}', role='client', email=f'owner{i}@example.com', password_hash='x')
+            db.session.add(other)
+            db.session.flush()
+            for owner_id, target_id in ((client_id, other.id), (other.id, client_id)):
+                domain = Domain(name=f'list{i}-{owner_id}.com', user_id=owner_id, status='Active', expiry_date=today)
+                db.session.add(domain)
+                db.session.flush()
+                db.session.add(Invoice(invoice_number=f'INV-L{i}-{owner_id}', user_id=owner_id, domain_id=domain.id, description='Renewal', amount=10.0, due_date=today))
+                db.session.add_all([
+                    DomainRequest(user_id=owner_id, domain_id=domain.id, domain_name=domain.name, request_type=request_type, requested_data=data)
+                    for request_type, data in (('renew', {}), ('lock_change', {'requestedLockStatus': False}), ('dns_change', {}),
+                                               ('internal_transfer_request', {'target_client_id': target_id}))
+                ])
+                ticket = SupportTicket(user_id=owner_id, subject=f'Ticket {i}', message='Help', related_domain_id=domain.id)
+                db.session.add(ticket)
+                db.session.flush()
+                db.session.add_all([TicketReply(ticket_id=ticket.id, user_id=owner_id, message='More'),
+                                    TicketReply(ticket_id=ticket.id, user_id=target_id, message='Answer')])
+        db.session.commit()
+
+
+ENDPOINTS = [
+    ('client1', '/api/domains'),
+    ('client1', '/api/client/pending-lock-requests'),
+    ('client1', '/api/client/pending-dns-requests'),
+    ('client1', '/api/invoices'),
+    ('client1', '/api/support-tickets'),
+    ('admin', '/api/admin/requests/recent-pending'),
+    ('admin', '/api/admin/requests/renewals/pending'),
+    ('admin', '/api/admin/requests/internal-transfers/pending'),
+    ('admin', '/api/admin/requests/support-tickets/all'),
+    ('admin', '/api/admin/all-domains'),
+    ('admin', '/api/admin/clients'),
+    ('admin', '/api/admin/client/{client_id}/details'),
+    ('admin', '/api/admin/domain/{domain_id}/details'),
+    ('admin', '/api/admin/invoices'),
+]
+
+
+@pytest.mark.parametrize('username,url', ENDPOINTS)
+def test_statement_count_does_not_grow_with_rows(app, users, login, count_statements, username, url):
+    client_id = users['client1']
+    client = login(username)
+
+    def measure():
+        with app.app_context():
+            domain_id = db.session.query(Domain.id).filter_by(user_id=client_id).order_by(Domain.id).limit(1).scalar()
+        with count_statements() as counter:
+            response = client.get(url.format(client_id=client_id, domain_id=domain_id))
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return counter.count
+
+    add_rows(app, client_id, 0, 2)
+    few = measure()
+    add_rows(app, client_id, 2, 4)
+    many = measure()
+    assert many == few, f'{url}: {few} statements for 2 rows per list, {many} for 6'
+
+
+def encode(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+@pytest.mark.parametrize('url,cursor', [
+    ('/api/admin/requests/renewals/pending', encode([5, 1])),
+    ('/api/admin/requests/renewals/pending', encode(['yesterday', 1])),
+    ('/api/admin/requests/renewals/pending', encode(['2024-01-01T00:00:00', [1]])),
+    ('/api/admin/requests/renewals/pending', encode(['2024-01-01T00:00:00', True])),
+    ('/api/admin/requests/renewals/pending', encode(['2024-01-01T00:00:00'])),
+    ('/api/admin/all-domains', encode([{'name': 'a.com'}, 1])),
+    ('/api/admin/all-domains', encode(['a.com', '1'])),
+    ('/api/admin/invoices', encode([20240101, 1])),
+    ('/api/admin/invoices', encode({'issue_date': '2024-01-01'})),
+    ('/api/admin/invoices', 'not a cursor'),
+])
+def test_malformed_cursor_is_a_bad_request(app, login, url, cursor):
+    response = login('admin').get(url, query_string={'cursor': cursor})
+    assert response.status_code == 400
+    assert response.json == {'error': 'Malformed cursor.'}
+
+
+def test_next_cursor_round_trips(app, users, login):
+    add_rows(app, users['client1'], 0, 2)
+    admin = login('admin')
+    for url, key in (('/api/admin/requests/renewals/pending', 'requests'), ('/api/admin/all-domains', 'domains'), ('/api/admin/invoices', 'invoices')):
+        first = admin.get(url, query_string={'limit': 2}).json
+        second = admin.get(url, query_string={'limit': 2, 'cursor': first['next_cursor']})
+        assert second.status_code == 200, second.get_data(as_text=True)
+        assert second.json[key] and not {row['id'] for row in first[key]} & {row['id'] for row in second.json[key]}
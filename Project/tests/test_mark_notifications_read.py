@@ -0,0 +1,81 @@
+"""POST /api/notifications/mark-read: one bulk UPDATE for personal ids plus the broadcast watermark; the unread count
+it returns (and the stored counter) must match what is actually left unread."""
+import pytest
+
+import app as app_module
+from app import db, Notification
+
+
+def notify(app, user_id, count):
+    with app.app_context():
+        rows = [Notification(user_id=user_id, message=f'Message {i}') for i in range(count)]
+        db.session.add_all(rows)
+        db.session.commit()
+        return [row.id for row in rows]
+
+
+def broadcast(app, count):
+    with app.app_context():
+        for i in range(count): app_module.create_broadcast_notification('admin', f'Ticket {i}')
+        db.session.commit()
+        return [b.id for b in app_module.BroadcastNotification.query.order_by(app_module.BroadcastNotification.id)]
+
+
+def unread(app, user_id):
+    with app.app_context():
+        assert app_module.verify_notification_counters()
+        return db.session.query(Notification.id).filter_by(user_id=user_id, is_read=False).count()
+
+
+def mark(client, ids):
+    response = client.post('/api/notifications/mark-read', json={'ids': ids})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return response.json
+
+
+def test_explicit_ids(app, users, login):
+    ids = notify(app, users['client1'], 3)
+    client = login('client1')
+    result = mark(client, [ids[0], str(ids[1])])
+    assert sorted(result['marked_ids']) == ids[:2]
+    assert result['unread_count'] == unread(app, users['client1']) == 1
+    result = mark(client, [ids[0]]) # Already read: not counted twice
+    assert result['marked_ids'] == [] and result['unread_count'] == 1
+
+
+@pytest.mark.parametrize('ids', ['all', []])
+def test_all_or_empty_marks_everything(app, users, login, ids):
+    personal_ids = notify(app, users['admin'], 2)
+    broadcast_ids = broadcast(app, 3)
+    admin = login('admin')
+    assert admin.get('/api/notifications').json['unread_count'] == 5
+    result = mark(admin, ids)
+    assert sorted(result['marked_ids']) == personal_ids
+    assert result['broadcast_last_read_id'] == broadcast_ids[-1]
+    assert result['unread_count'] == 0 == unread(app, users['admin'])
+    assert admin.get('/api/notifications').json['unread_count'] == 0
+
+
+def test_mixed_personal_and_broadcast_ids(app, users, login):
+    personal_ids = notify(app, users['admin'], 3)
+    broadcast_ids = broadcast(app, 3)
+    result = mark(login('admin'), [personal_ids[1], f'b{broadcast_ids[1]}', 'nonsense', True, None])
+    assert result['marked_ids'] == [personal_ids[1]]
+    assert result['broadcast_last_read_id'] == broadcast_ids[1] # Watermark: the first two broadcasts are read
+    assert result['unread_count'] == 2 + 1
+    assert unread(app, users['admin']) == 2
+
+
+def test_ids_owned_by_someone_else_are_left_alone(app, users, login):
+    notify(app, users['client1'], 1)
+    other_ids = notify(app, users['client2'], 2)
+    result = mark(login('client1'), other_ids)
+    assert result['marked_ids'] == []
+    assert result['unread_count'] == 1 == unread(app, users['client1'])
+    assert unread(app, users['client2']) == 2
+    assert login('client2').get('/api/notifications').json['unread_count'] == 2
+
+
+def test_ids_must_be_a_list_or_all(app, login):
+    response = login('client1').post('/api/notifications/mark-read', json={'ids': 5})
+    assert response.status_code == 400
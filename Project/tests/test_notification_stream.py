@@ -0,0 +1,108 @@
+"""/api/notifications/stream: live events, Last-Event-ID resume of both feeds, and the per-process stream cap."""
+import threading
+import time
+
+import pytest
+
+import app as app_module
+from app import db, Notification
+
+
+@pytest.fixture(autouse=True)
+def short_streams(monkeypatch):
+    """Streams end on their own after a moment, so a test can read the whole response."""
+    monkeypatch.setattr(app_module, 'NOTIFICATION_STREAM_MAX_SECONDS', 0.6)
+    monkeypatch.setattr(app_module, 'NOTIFICATION_STREAM_HEARTBEAT_SECONDS', 0.1)
+
+
+def parse_events(body):
+    events = []
+    for block in body.split('\n\n'):
+        fields = dict(line.split(': ', 1) for line in block.splitlines() if ': ' in line and not line.startswith(':'))
+        if 'event' in fields: events.append(fields)
+    return events
+
+
+def notify(app, user_id, count):
+    with app.app_context():
+        rows = [Notification(user_id=user_id, message=f'Message {i}') for i in range(count)]
+        db.session.add_all(rows)
+        db.session.commit()
+        return [row.id for row in rows]
+
+
+def broadcast(app, message):
+    with app.app_context():
+        app_module.create_broadcast_notification('admin', message)
+        db.session.commit()
+        return db.session.query(db.func.max(app_module.BroadcastNotification.id)).scalar()
+
+
+def stream(client, last_event_id=None):
+    headers = {'Last-Event-ID': last_event_id} if last_event_id else {}
+    response = client.get('/api/notifications/stream', headers=headers)
+    events = parse_events(response.get_data(as_text=True)) if response.status_code == 200 else None
+    response.close() # As the server does once the client goes away
+    return response, events
+
+
+def test_fresh_stream_sends_only_new_notifications(app, users, login):
+    notify(app, users['client1'], 2) # Already shown by the initial /api/notifications fetch
+    client = login('client1')
+
+    def notify_later():
+        time.sleep(0.2)
+        notify(app, users['client1'], 1)
+    writer = threading.Thread(target=notify_later)
+    writer.start()
+    response, events = stream(client)
+    writer.join()
+
+    assert response.mimetype == 'text/event-stream'
+    assert [(e['event'], e.get('id')) for e in events] == [('unread_count', None), ('notification', '3-0'), ('unread_count', None)]
+    assert [e['data'] for e in events if e['event'] == 'unread_count'] == ['{"unread_count": 2}', '{"unread_count": 3}']
+    assert '"message": "Message 0"' in events[1]['data']
+
+
+def test_last_event_id_resumes_both_feeds(app, users, login):
+    personal_ids = notify(app, users['admin'], 3)
+    first_broadcast = broadcast(app, 'First ticket')
+    second_broadcast = broadcast(app, 'Second ticket')
+    admin = login('admin')
+
+    _, events = stream(admin, f'{personal_ids[0]}-{first_broadcast}')
+    sent = [(e['id'], e['data']) for e in events if e['event'] == 'notification']
+    assert [event_id for event_id, _ in sent] == [f'{personal_ids[1]}-{first_broadcast}', f'{personal_ids[2]}-{first_broadcast}',
+                                                  f'{personal_ids[2]}-{second_broadcast}']
+    assert 'Second ticket' in sent[-1][1]
+
+    _, events = stream(admin, str(personal_ids[1])) # Personal-only cursor: broadcasts start at the newest
+    assert [e['id'] for e in events if e['event'] == 'notification'] == [f'{personal_ids[2]}-{second_broadcast}']
+
+    _, events = stream(admin, f'{personal_ids[2]}-{second_broadcast}')
+    assert [e['event'] for e in events] == ['unread_count']
+
+
+@pytest.mark.parametrize('last_event_id', ['abc', '1-2-3', '1-x'])
+def test_invalid_last_event_id_is_refused(app, login, last_event_id):
+    response, _ = stream(login('client1'), last_event_id)
+    assert response.status_code == 400
+
+
+def test_streams_beyond_the_cap_are_refused(app, login, monkeypatch):
+    monkeypatch.setattr(app_module, 'notification_stream_slots', app_module.StreamSlots(1))
+    client = login('client1')
+    held = client.get('/api/notifications/stream') # Open, not yet read
+    response, _ = stream(client)
+    assert response.status_code == 503
+    held.close()
+    assert app_module.notification_stream_slots.open == 0
+    response, _ = stream(client) # The closed stream gave its slot back
+    assert response.status_code == 200
+    assert app_module.notification_stream_slots.open == 0
+
+
+def test_streaming_can_be_switched_off(app, login, monkeypatch):
+    monkeypatch.setattr(app_module, 'notification_stream_slots', app_module.StreamSlots(0))
+    response, _ = stream(login('client1'))
+    assert response.status_code == 503
@@ -0,0 +1,60 @@
+"""Dashboard pending counters: both endpoints keep their original JSON keys and count everything in one statement."""
+from app import db, DomainRequest, SupportTicket
+
+CLIENT_KEYS = {
+    'registrations', 'renewals', 'auto_renew_changes', 'lock_changes', 'pending_transfers_in', 'pending_transfers_out',
+    'pending_dns_changes', 'pending_contact_updates', 'pending_payment_proofs', 'pending_internal_transfers', 'open_support_tickets',
+}
+ADMIN_KEYS = {
+    'pending_registrations', 'pending_renewals', 'pending_auto_renew_changes', 'pending_lock_changes', 'pending_transfers_in',
+    'pending_transfers_out', 'pending_internal_transfers', 'pending_dns_changes', 'pending_contact_updates', 'pending_payment_proofs',
+    'open_support_tickets', 'total_managed_domains', 'total_clients',
+}
+
+
+def add_mixed_requests(app, users, client_domains):
+    """On top of client1's three pending renewals: requests and tickets in counted and uncounted states for both clients."""
+    with app.app_context():
+        client1, client2 = users['client1'], users['client2']
+        db.session.add_all([
+            DomainRequest(user_id=client1, domain_name='new1.com', request_type='register'),
+            DomainRequest(user_id=client1, domain_name='new2.com', request_type='register', status='Completed'),
+            DomainRequest(user_id=client1, domain_id=client_domains[0], request_type='lock_change', requested_data={'requestedLockStatus': False}),
+            DomainRequest(user_id=client2, domain_name='other.com', request_type='dns_change'),
+            DomainRequest(user_id=client2, domain_name='other.com', request_type='renew', status='Rejected'),
+            SupportTicket(user_id=client1, subject='Open', message='Help', status='Open'),
+            SupportTicket(user_id=client1, subject='Working', message='Help', status='In Progress'),
+            SupportTicket(user_id=client1, subject='Done', message='Help', status='Closed'),
+            SupportTicket(user_id=client2, subject='Open', message='Help', status='Open'),
+        ])
+        DomainRequest.query.filter_by(domain_id=client_domains[2], request_type='renew').one().status = 'Completed'
+        db.session.commit()
+
+
+def get_counted(client, url, count_statements):
+    with count_statements() as counter:
+        response = client.get(url)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    counting = [s for s in counter.statements if 'request_counters' in s or 'support_ticket' in s]
+    assert len(counting) == 1, counting # Requests, tickets (and the admin totals) in one UNION ALL
+    return response.json
+
+
+def test_client_pending_counts(app, users, client_domains, login, count_statements):
+    add_mixed_requests(app, users, client_domains)
+    counts = get_counted(login('client1'), '/api/client/pending-request-counts', count_statements)
+    assert set(counts) == CLIENT_KEYS
+    assert {key: value for key, value in counts.items() if value} == {'registrations': 1, 'renewals': 2, 'lock_changes': 1, 'open_support_tickets': 2}
+
+    counts = get_counted(login('client2'), '/api/client/pending-request-counts', count_statements)
+    assert {key: value for key, value in counts.items() if value} == {'pending_dns_changes': 1, 'open_support_tickets': 1}
+
+
+def test_admin_dashboard_summary(app, users, client_domains, login, count_statements):
+    add_mixed_requests(app, users, client_domains)
+    summary = get_counted(login('admin'), '/api/admin/dashboard-summary', count_statements)
+    assert set(summary) == ADMIN_KEYS
+    assert {key: value for key, value in summary.items() if value} == {
+        'pending_registrations': 1, 'pending_renewals': 2, 'pending_lock_changes': 1, 'pending_dns_changes': 1,
+        'open_support_tickets': 3, 'total_managed_domains': 3, 'total_clients': 2,
+    }
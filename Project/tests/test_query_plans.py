@@ -0,0 +1,29 @@
+import pytest
+
+import app as app_module
+from app import db
+
+
+@pytest.fixture(autouse=True)
+def sqlite_context(app):
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite':
+            pytest.skip('Reads SQLite EXPLAIN QUERY PLAN output')
+        yield
+
+
+def test_hot_queries_use_indexes_without_sorting(app):
+    plans = app_module.hot_query_plans()
+    problems = {label: app_module.query_plan_problems(plan) for label, plan in plans.items()}
+    assert not any(problems.values()), problems
+
+
+def test_notification_feed_reads_in_index_order(app):
+    plan = app_module.hot_query_plans()['notification feed']
+    assert any('USING INDEX ix_notification_user_timestamp' in step for step in plan), plan
+    assert not any('TEMP B-TREE' in step for step in plan), plan
+
+
+def test_explain_hot_queries_cli_passes(app, capsys):
+    assert app_module.explain_hot_queries()
+    assert 'FAIL' not in capsys.readouterr().out
@@ -0,0 +1,93 @@
+import socket
+import time
+from concurrent.futures import wait
+
+import pytest
+from namecheapapi.api import session as namecheap_session
+
+import app as app_module
+
+
+class FakeDomainAPI:
+    """Stands in for namecheapapi.DomainAPI: logs a warning on every response and an error on failed ones."""
+    def __init__(self, fail=False):
+        self.fail, self.errors, self.warnings = fail, [], []
+
+    def check(self, names):
+        self.warnings.append({'Warnings': ['slow response']})
+        if self.fail:
+            self.errors.append({'Errors': ['internal error']})
+            raise RuntimeError('registrar error')
+        return {name: True for name in names}
+
+
+class HangingDomainAPI(FakeDomainAPI):
+    """Calls the real (wrapped) urlopen against a server that accepts the connection and never answers."""
+    def __init__(self, url):
+        super().__init__()
+        self.url = url
+
+    def check(self, names):
+        namecheap_session.urlopen(self.url).read()
+
+
+@pytest.fixture
+def hanging_server():
+    server = socket.socket()
+    server.bind(('127.0.0.1', 0))
+    server.listen() # Never accepted: connect succeeds via the backlog, the response never comes
+    yield f'http://127.0.0.1:{server.getsockname()[1]}/xml.response'
+    server.close()
+
+
+@pytest.fixture
+def registrar():
+    client = app_module.RegistrarClient()
+    yield client
+    client.executor.shutdown(wait=False)
+
+
+def test_shared_api_response_logs_stay_bounded(registrar):
+    api = FakeDomainAPI()
+    for i in range(100):
+        registrar._check_chunk(api, [f'name{i}.com'])
+    api.fail = True
+    for i in range(100):
+        with pytest.raises(RuntimeError):
+            registrar._check_chunk(api, [f'fail{i}.com'])
+    assert len(api.warnings) == app_module.API_RESPONSE_LOG_SIZE
+    assert len(api.errors) == app_module.API_RESPONSE_LOG_SIZE
+
+
+def test_degraded_suggestions_count_as_rejected_calls(registrar):
+    breaker = registrar.breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure('timeout')
+    assert not breaker.allow()
+    assert breaker.is_open()
+    assert breaker.snapshot()['rejected_calls'] == 2
+    breaker.record_success()
+    assert not breaker.is_open()
+    assert breaker.snapshot()['rejected_calls'] == 2
+
+
+def test_hung_registrar_call_releases_its_worker(monkeypatch, hanging_server):
+    monkeypatch.setattr(app_module, 'REGISTRAR_CHECK_WORKERS', 1)
+    monkeypatch.setattr(app_module, 'REGISTRAR_HTTP_TIMEOUT_SECONDS', 0.5)
+    registrar = app_module.RegistrarClient()
+    registrar._api = HangingDomainAPI(hanging_server)
+    try:
+        results, pending = registrar.check(['hung.com'], deadline=0.1)
+        assert pending == ['hung.com'] # The caller stopped waiting; the call is still running
+        (future,) = set(registrar.in_flight.values())
+        assert future in wait(registrar.in_flight.values(), timeout=5).done # ...until the socket timeout ends it
+        assert isinstance(future.exception(), TimeoutError)
+        assert registrar.in_flight == {} and registrar.api_errors == 1
+
+        registrar.breaker.record_success()
+        registrar._api = FakeDomainAPI() # The single worker is free for the next check
+        started = time.monotonic()
+        assert registrar.check(['free.com'], deadline=2) == ({'free.com': True}, [])
+        assert time.monotonic() - started < 1
+    finally:
+        registrar.executor.shutdown(wait=False)
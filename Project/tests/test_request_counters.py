@@ -0,0 +1,50 @@
+"""request_counters is maintained on flush; after any mix of writes it must equal a GROUP BY over domain_request."""
+import app as app_module
+from app import db, DomainRequest, RequestCounter
+
+
+def stored_counts():
+    return {(c.user_id, c.request_type, c.status): c.count for c in RequestCounter.query if c.count}
+
+
+def test_counters_follow_mixed_writes(app, users, client_domains):
+    with app.app_context():
+        first, second, third = DomainRequest.query.order_by(DomainRequest.id).all()
+        db.session.add_all([DomainRequest(user_id=users['client2'], domain_name='new.com', request_type='register'),
+                            DomainRequest(user_id=users['client1'], domain_name='other.com', request_type='register')])
+        first.status = 'Approved'
+        second.request_type = 'auto_renew_change'
+        third.user_id = users['client2']
+        db.session.flush()
+        third.status = 'Rejected'
+        db.session.delete(second)
+        db.session.commit()
+
+        assert stored_counts() == app_module._count_requests_from_source()
+        assert app_module.verify_request_counters()
+        assert app_module.get_pending_counts(users['client1']).get('renew', 0) == 0
+        assert app_module.get_pending_counts()['register'] == 2
+
+
+def test_rollback_discards_deltas(app, users, client_domains):
+    with app.app_context():
+        before = stored_counts()
+        db.session.add(DomainRequest(user_id=users['client1'], domain_name='gone.com', request_type='register'))
+        DomainRequest.query.first().status = 'Approved'
+        db.session.flush()
+        assert stored_counts() != before
+        db.session.rollback()
+        assert stored_counts() == before == app_module._count_requests_from_source()
+
+
+def test_verify_detects_drift_and_rebuild_repairs_it(app, users, client_domains, capsys):
+    with app.app_context():
+        db.session.execute(db.update(RequestCounter).where(RequestCounter.user_id == users['client1']).values(count=RequestCounter.count + 1))
+        db.session.add(RequestCounter(user_id=users['client2'], request_type='renew', status='Approved', count=4))
+        db.session.commit()
+        assert not app_module.verify_request_counters()
+        assert 'request_counters has 2 mismatched row(s)' in capsys.readouterr().out
+
+        app_module.rebuild_request_counters()
+        assert app_module.verify_request_counters()
+        assert stored_counts() == app_module._count_requests_from_source()
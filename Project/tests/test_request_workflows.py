@@ -0,0 +1,122 @@
+"""REQUEST_WORKFLOWS replaced update_request_status_generic's if-chain. Each (request_type, status) pair the chain
+handled must dispatch to a handler with the same side effects, and every other pair must fall through: the request
+just takes the new status and nothing else changes."""
+import datetime
+
+import pytest
+
+import app as app_module
+from app import db, Domain, DomainRequest, Invoice, Notification
+
+TODAY = datetime.date.today()
+YEAR = datetime.timedelta(days=365)
+
+BASELINE_PAIRS = {
+    ('register', 'Approved'), ('renew', 'Approved'), ('payment_proof', 'Approved'), ('transfer_in', 'Completed'),
+    ('transfer_out', 'EPP Code Sent'), ('transfer_out', 'Completed'), ('dns_change', 'Approved'), ('contact_update', 'Approved'),
+    ('auto_renew_change', 'Approved'), ('lock_change', 'Approved'), ('internal_transfer_request', 'Approved'),
+}
+
+
+def test_registry_covers_exactly_the_baseline_pairs():
+    assert set(app_module.REQUEST_WORKFLOWS) == BASELINE_PAIRS
+
+
+def domain_named(name):
+    return Domain.query.filter_by(name=name).one_or_none()
+
+
+# (request_type, status, request fields, extra payload, final request status, check(request, site0, users))
+# site0.com is client1's domain from the client_domains fixture: Active, expiring today, locked, no auto-renew, invoiced by INV-1.
+# The status route picks only the model from its path segment, so every case goes through /requests/renewals/.
+WORKFLOW_CASES = [
+    ('register', 'Approved', {'domain_name': 'brandnew.com', 'requested_data': {'registrationDurationYears': 2, 'autoRenew': True}}, {}, 'Completed',
+     lambda req, site0, users: (req.domain.name, req.domain.user_id, req.domain.expiry_date, req.domain.auto_renew)
+                               == ('brandnew.com', users['client1'], TODAY + 2 * YEAR, True)),
+    ('renew', 'Approved', {'requested_data': {'renewalDurationYears': 2}}, {}, 'Completed',
+     lambda req, site0, users: (site0.expiry_date, site0.status) == (TODAY + 2 * YEAR, 'Active')),
+    ('renew', 'Approved', {'domain_id': None, 'domain_name': 'gone.com', 'requested_data': {}}, {}, 'Failed',
+     lambda req, site0, users: 'Domain not found.' in req.admin_notes and site0.expiry_date == TODAY),
+    ('payment_proof', 'Approved', {'invoice': True}, {}, 'Completed',
+     lambda req, site0, users: (req.invoice.status, req.invoice.payment_date) == ('Paid', TODAY)),
+    ('transfer_in', 'Completed', {'domain_id': None, 'domain_name': 'incoming.com'}, {}, 'Completed',
+     lambda req, site0, users: (domain_named('incoming.com').user_id, domain_named('incoming.com').expiry_date) == (users['client1'], TODAY + YEAR)),
+    ('transfer_in', 'Completed', {'user': 'client2'}, {}, 'Completed',
+     lambda req, site0, users: (site0.user_id, req.domain_id) == (users['client2'], site0.id)),
+    ('transfer_out', 'EPP Code Sent', {'requested_data': {'reason': 'moving'}}, {'epp_code': 'EPP-123'}, 'EPP Code Sent',
+     lambda req, site0, users: req.requested_data == {'reason': 'moving', 'epp_code_provided_by_admin': 'EPP-123'} and site0.status == 'Active'),
+    ('transfer_out', 'Completed', {}, {}, 'Completed',
+     lambda req, site0, users: site0.status == 'Transferred Out'),
+    ('dns_change', 'Approved', {}, {}, 'Completed', lambda req, site0, users: True),
+    ('contact_update', 'Approved', {}, {}, 'Completed', lambda req, site0, users: True),
+    ('auto_renew_change', 'Approved', {'requested_data': {'requestedAutoRenewStatus': True}}, {}, 'Completed',
+     lambda req, site0, users: site0.auto_renew is True),
+    ('auto_renew_change', 'Approved', {'requested_data': {'requestedAutoRenewStatus': 'yes'}}, {}, 'Failed',
+     lambda req, site0, users: 'Invalid auto-renew status.' in req.admin_notes and site0.auto_renew is False),
+    ('lock_change', 'Approved', {'requested_data': {'requestedLockStatus': False}}, {}, 'Completed',
+     lambda req, site0, users: site0.is_locked is False),
+    ('internal_transfer_request', 'Approved', {'requested_data': {'target_client_id': 'client2'}}, {}, 'Completed',
+     lambda req, site0, users: site0.user_id == users['client2']),
+    ('internal_transfer_request', 'Approved', {'requested_data': {'target_client_id': 999999}}, {}, 'Failed',
+     lambda req, site0, users: 'Domain or target client not found.' in req.admin_notes and site0.user_id == users['client1']),
+]
+
+# Pairs the baseline chain had no branch for: the status is stored as given and nothing else is touched
+FALL_THROUGH_CASES = [
+    ('register', 'Processing'), ('register', 'Rejected'), ('renew', 'Rejected'), ('renew', 'Completed'),
+    ('transfer_in', 'Approved'), ('transfer_out', 'Approved'), ('dns_change', 'Completed'), ('lock_change', 'Rejected'),
+    ('payment_proof', 'Rejected'), ('internal_transfer_request', 'Cancelled by Client'), ('made_up_type', 'Approved'),
+]
+
+
+def add_request(app, users, site0_id, request_type, fields):
+    fields = dict(fields)
+    with app.app_context():
+        site0 = db.session.get(Domain, site0_id)
+        data = fields.pop('requested_data', {})
+        if isinstance(data.get('target_client_id'), str): data['target_client_id'] = users[data['target_client_id']]
+        if fields.pop('invoice', False): fields['invoice_id'] = Invoice.query.filter_by(invoice_number='INV-1').one().id
+        owner = users[fields.pop('user', 'client1')]
+        req = DomainRequest(user_id=owner, request_type=request_type, requested_data=data,
+                            **{'domain_id': site0.id, 'domain_name': site0.name, **fields})
+        db.session.add(req)
+        db.session.commit()
+        return req.id
+
+
+def snapshot():
+    return ([(d.name, d.user_id, d.status, d.expiry_date, d.auto_renew, d.is_locked) for d in Domain.query.order_by(Domain.id)],
+            [(i.status, i.payment_date) for i in Invoice.query.order_by(Invoice.id)])
+
+
+def status_notifications(req):
+    return [n.message for n in Notification.query.filter_by(link=f'#request-{req.id}', notification_type=f'{req.request_type}_status_update')]
+
+
+@pytest.mark.parametrize('request_type,status,fields,payload,final_status,check', WORKFLOW_CASES,
+                         ids=[f'{case[0]}-{case[1]}-{i}' for i, case in enumerate(WORKFLOW_CASES)])
+def test_workflow_side_effects(app, users, client_domains, login, request_type, status, fields, payload, final_status, check):
+    site0_id = client_domains[0]
+    req_id = add_request(app, users, site0_id, request_type, fields)
+    response = login('admin').put(f'/api/admin/requests/renewals/{req_id}/status', json={'status': status, **payload})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    with app.app_context():
+        req = db.session.get(DomainRequest, req_id)
+        assert req.status == final_status
+        assert check(req, db.session.get(Domain, site0_id), users)
+        assert len(status_notifications(req)) == 1 # The client hears about the requested status, as before
+        assert app_module.verify_request_counters()
+
+
+@pytest.mark.parametrize('request_type,status', FALL_THROUGH_CASES)
+def test_unregistered_pairs_fall_through(app, users, client_domains, login, request_type, status):
+    site0_id = client_domains[0]
+    req_id = add_request(app, users, site0_id, request_type, {'requested_data': {'renewalDurationYears': 1, 'requestedLockStatus': False}})
+    with app.app_context():
+        before = snapshot()
+    response = login('admin').put(f'/api/admin/requests/renewals/{req_id}/status', json={'status': status, 'admin_notes': 'Checked'})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    with app.app_context():
+        req = db.session.get(DomainRequest, req_id)
+        assert (req.status, req.admin_notes) == (status, 'Checked')
+        assert snapshot() == before
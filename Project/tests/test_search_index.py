@@ -0,0 +1,124 @@
+"""Admin search boxes: the FTS5 trigram index (kept in sync by triggers) must return exactly the rows the ILIKE scan it
+replaced would, on both the all-domains and the invoices endpoint, however the indexed rows change."""
+import datetime
+
+import pytest
+
+import app as app_module
+from app import db, Domain, Invoice, User
+from sqlalchemy import or_
+
+SEARCHES = {
+    'domain_search': ('/api/admin/all-domains', 'domains'),
+    'invoice_search': ('/api/admin/invoices', 'invoices'),
+}
+
+
+def ilike_ids(index_name, term):
+    """Ids the pre-index ILIKE filter matches: the reference every search is compared with."""
+    pattern = f'%{term}%'
+    if index_name == 'domain_search':
+        query = db.session.query(Domain.id).join(User, Domain.user_id == User.id, isouter=True)\
+                          .filter(or_(Domain.name.ilike(pattern), User.username.ilike(pattern), User.name.ilike(pattern)))
+    else:
+        query = db.session.query(Invoice.id).join(User, Invoice.user_id == User.id)\
+                          .filter(or_(Invoice.invoice_number.ilike(pattern), Invoice.description.ilike(pattern),
+                                      User.name.ilike(pattern), User.username.ilike(pattern)))
+    return {row_id for row_id, in query}
+
+
+def assert_search_matches_ilike(app, client, count_statements, index_name, term, expect_index=True):
+    url, key = SEARCHES[index_name]
+    with count_statements() as counter:
+        response = client.get(url, query_string={'search_term': term, 'limit': 200})
+    assert response.status_code == 200, response.get_data(as_text=True)
+    used_index = any(f'{index_name} MATCH' in statement for statement in counter.statements)
+    assert used_index == (expect_index and db_is_sqlite(app) and len(term) >= app_module.SEARCH_INDEX_MIN_TERM_LENGTH)
+    with app.app_context():
+        expected = ilike_ids(index_name, term)
+    assert {row['id'] for row in response.json[key]} == expected
+    return expected
+
+
+def db_is_sqlite(app):
+    with app.app_context():
+        return db.engine.dialect.name == 'sqlite'
+
+
+def search_domains(app, admin, count_statements, *terms, **kwargs):
+    return [assert_search_matches_ilike(app, admin, count_statements, 'domain_search', term, **kwargs) for term in terms]
+
+
+def search_invoices(app, admin, count_statements, *terms, **kwargs):
+    return [assert_search_matches_ilike(app, admin, count_statements, 'invoice_search', term, **kwargs) for term in terms]
+
+
+def test_domain_insert_rename_and_delete(app, users, client_domains, login, count_statements):
+    admin = login('admin')
+    assert search_domains(app, admin, count_statements, 'site', 'site1', 'client1', 'nothing-here')[:2] == [set(client_domains), {client_domains[1]}]
+    with app.app_context():
+        db.session.add_all([Domain(name='brand-new.net', user_id=users['client2'], status='Active'), Domain(name='orphan-site.org', status='Active')])
+        db.session.get(Domain, client_domains[1]).name = 'renamed.com'
+        db.session.delete(db.session.get(Domain, client_domains[2]))
+        db.session.commit()
+    site, site1, renamed, brand, orphan, client2 = search_domains(app, admin, count_statements, 'site', 'site1', 'renamed', 'brand', 'orphan', 'client2')
+    assert len(site) == 2 and site1 == set() and renamed == {client_domains[1]}
+    assert len(brand) == 1 and len(orphan) == 1 and brand <= client2
+
+
+def test_domain_owner_change(app, users, client_domains, login, count_statements):
+    admin = login('admin')
+    with app.app_context():
+        db.session.get(Domain, client_domains[0]).user_id = users['client2']
+        db.session.commit()
+    client1, client2 = search_domains(app, admin, count_statements, 'client1', 'client2')
+    assert client1 == set(client_domains[1:]) and client2 == {client_domains[0]}
+
+
+def test_owner_name_username_and_email_changes(app, users, client_domains, login, count_statements):
+    admin = login('admin')
+    with app.app_context():
+        owner = db.session.get(User, users['client1'])
+        owner.name, owner.username, owner.email = 'Zebediah Quill', 'zquill', 'zq@example.org'
+        db.session.commit()
+    for search in (search_domains, search_invoices):
+        old_name, old_username, new_name, new_username, email = search(app, admin, count_statements, 'Client1', 'client1', 'Zebediah', 'zquil', 'example.org')
+        assert old_name == old_username == email == set() # Email is not searchable, before or after
+        assert new_name == new_username and new_name
+    assert search_domains(app, admin, count_statements, 'Quill')[0] == set(client_domains)
+
+
+def test_invoice_changes(app, users, client_domains, login, count_statements):
+    admin = login('admin')
+    assert search_invoices(app, admin, count_statements, 'INV-1', 'Renewal', 'Client1')[0]
+    with app.app_context():
+        invoice = Invoice.query.filter_by(invoice_number='INV-1').one()
+        invoice.invoice_number, invoice.description, invoice.user_id = 'INV-900', 'Hosting upgrade', users['client2']
+        db.session.add(Invoice(invoice_number='INV-901', user_id=users['client1'], description='Transfer fee', amount=5, due_date=datetime.date.today()))
+        db.session.commit()
+    old_number, old_description, hosting, client2, client1, inv9 = search_invoices(app, admin, count_statements, 'INV-1', 'Renewal', 'hosting', 'client2', 'client1', 'INV-9')
+    assert old_number == old_description == set()
+    assert hosting == client2 and len(client1) == 1 and len(inv9) == 2
+    with app.app_context():
+        db.session.delete(Invoice.query.filter_by(invoice_number='INV-900').one())
+        db.session.commit()
+    assert search_invoices(app, admin, count_statements, 'hosting', 'INV-9') == [set(), client1]
+
+
+@pytest.mark.parametrize('term', ['s', 'si', 'IN', '1.'])
+def test_short_terms_use_ilike(app, users, client_domains, login, count_statements, term):
+    admin = login('admin')
+    search_domains(app, admin, count_statements, term)
+    search_invoices(app, admin, count_statements, term)
+
+
+def test_unavailable_index_falls_back_to_ilike(app, users, client_domains, login, count_statements, monkeypatch):
+    if not db_is_sqlite(app): pytest.skip('The index only exists on SQLite')
+    with app.app_context():
+        for index_name in SEARCHES: db.session.execute(db.text(f"DROP TABLE {index_name}"))
+        db.session.commit()
+    monkeypatch.setattr(app_module, '_search_index_present', None) # Re-detected on the next search, as after a restart
+    admin = login('admin')
+    assert search_domains(app, admin, count_statements, 'site', 'client1', expect_index=False)[0] == set(client_domains)
+    assert search_invoices(app, admin, count_statements, 'INV-1', expect_index=False)[0]
+    assert app_module._search_index_present is False
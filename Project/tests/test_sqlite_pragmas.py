@@ -0,0 +1,55 @@
+"""SQLite connection profile: every new DB-API connection gets SQLITE_PRAGMAS, an empty value keeps SQLite's own default,
+other drivers are left alone, and a value that isn't a bare word or number stops the app at import."""
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+from sqlalchemy import create_engine
+
+import app as app_module
+from app import db
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def read_pragmas(connection, *names):
+    return {name: connection.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
+
+
+def test_pooled_connections_get_the_profile(app):
+    with app.app_context():
+        if db.engine.dialect.name != 'sqlite': pytest.skip('SQLite-only profile')
+        with db.engine.connect() as first, db.engine.connect() as second: # Two pool connections, each set up on connect
+            for connection in (first, second):
+                assert read_pragmas(connection, 'journal_mode', 'busy_timeout', 'synchronous', 'temp_store') == {
+                    'journal_mode': 'wal', 'busy_timeout': 5000, 'synchronous': 1, 'temp_store': 2}
+
+
+def test_empty_value_keeps_the_sqlite_default(tmp_path, monkeypatch):
+    defaults_engine = create_engine('sqlite:///' + str(tmp_path / 'defaults.db'))
+    for pragma in ('journal_mode', 'synchronous', 'temp_store'):
+        monkeypatch.setitem(app_module.SQLITE_PRAGMAS, pragma, '')
+    try:
+        with defaults_engine.connect() as connection:
+            assert read_pragmas(connection, 'journal_mode', 'synchronous', 'temp_store', 'busy_timeout') == {
+                'journal_mode': 'delete', 'synchronous': 2, 'temp_store': 0, 'busy_timeout': 5000}
+    finally:
+        defaults_engine.dispose()
+
+
+def test_other_drivers_are_skipped():
+    class OtherConnection:
+        def cursor(self): raise AssertionError('PRAGMAs sent to a non-SQLite connection')
+    record = types.SimpleNamespace(info={})
+    app_module._apply_sqlite_pragmas(OtherConnection(), record)
+    assert record.info == {}
+
+
+@pytest.mark.parametrize('value', ['NORMAL; DROP TABLE user', 'FULL --', '1.5'])
+def test_invalid_value_is_rejected_at_import(tmp_path, value):
+    env = dict(os.environ, SQLITE_SYNCHRONOUS=value, DATABASE_URL='sqlite:///' + str(tmp_path / 'import.db'))
+    result = subprocess.run([sys.executable, '-c', 'import app'], cwd=PROJECT_DIR, env=env, capture_output=True, text=True, timeout=60)
+    assert result.returncode != 0
+    assert 'Invalid value for SQLite pragma synchronous' in result.stderr
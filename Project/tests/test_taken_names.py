@@ -0,0 +1,61 @@
+import app as app_module
+from app import db, CacheVersion, Domain, DomainRequest
+
+index = app_module.taken_name_index
+
+
+def stamp(app):
+    with app.app_context():
+        return db.session.get(CacheVersion, app_module.TakenNameIndex.VERSION_KEY).version
+
+
+def load_index(app):
+    with app.app_context():
+        index.matches([], max_staleness=0)
+        return index.version
+
+
+def test_requests_about_existing_domains_leave_the_stamp_alone(app, client_domains, login):
+    client = login('client1')
+    before = load_index(app)
+    assert client.post(f'/api/domain-requests/renew/{client_domains[0]}', json={'renewalDurationYears': 1}).status_code == 201
+    response = client.post('/api/domain-requests/bulk-renew', json={'domain_ids': client_domains[1:]})
+    assert response.status_code in (200, 201), response.get_data(as_text=True)
+    assert stamp(app) == before
+    assert index.version == before # Applied locally, not reloaded
+    assert index.pending['site0.com'] == 2
+
+
+def test_name_changes_bump_the_stamp(app, client_domains, login):
+    client = login('client1')
+    before = load_index(app)
+    response = client.post('/api/domain-requests/register', json={'requestedDomainName': 'fresh', 'requestedTld': '.com', 'registrationDurationYears': 1})
+    assert response.status_code == 201
+    assert stamp(app) == before + 1
+    assert index.version == before + 1
+    with app.app_context():
+        assert index.matches(['fresh.com', 'other.com'], max_staleness=0) == {'fresh.com'}
+        db.session.get(Domain, client_domains[2]).name = 'renamed.com'
+        db.session.commit()
+        assert stamp(app) == before + 2
+        assert index.matches(['site2.com', 'renamed.com'], any_pending=True, max_staleness=0) == {'site2.com', 'renamed.com'}
+
+
+def test_query_locally_taken_names_across_chunks(app, users, count_statements):
+    chunk_size = app_module.SQLITE_IN_CHUNK_SIZE
+    names = [f'name{i}.com' for i in range(2 * chunk_size + 10)] # Three chunks, the last one short
+    registered, pending_register, pending_other = names[5::chunk_size], names[7::chunk_size], names[9::chunk_size]
+    with app.app_context():
+        db.session.add_all([Domain(name=name, status='Active') for name in registered])
+        db.session.add_all([DomainRequest(user_id=users['client1'], domain_name=name, request_type='register') for name in pending_register])
+        db.session.add_all([DomainRequest(user_id=users['client1'], domain_name=name, request_type='dns_change') for name in pending_other])
+        db.session.add_all([DomainRequest(user_id=users['client2'], domain_name=name, request_type=request_type, status='Completed')
+                            for name in names[11::chunk_size] for request_type in ('register', 'dns_change')]) # Not pending: never taken
+        db.session.commit()
+        expected = {False: set(registered + pending_register), True: set(registered + pending_register + pending_other)}
+        for any_pending in (False, True):
+            with count_statements() as counter:
+                taken = app_module.query_locally_taken_names(names + names[:50], any_pending=any_pending) # Repeats are checked once
+            assert taken == expected[any_pending]
+            assert counter.count == 3, counter.statements
+            assert taken == index.matches(names, any_pending=any_pending, max_staleness=0)
@@ -0,0 +1,79 @@
+"""Ticket lists carry reply summaries only; the replies themselves are paged oldest-first by /support-tickets/<id>/replies."""
+import datetime
+
+import pytest
+
+import app as app_module
+from app import db, SupportTicket, TicketReply
+
+START = datetime.datetime(2024, 1, 1, 12, 0)
+
+
+def add_ticket(app, user_id, reply_count, replier_id=None):
+    with app.app_context():
+        ticket = SupportTicket(user_id=user_id, subject='Help', message='Please')
+        db.session.add(ticket)
+        db.session.flush()
+        db.session.add_all([TicketReply(ticket_id=ticket.id, user_id=replier_id or user_id, message=f'Reply {i}',
+                                        timestamp=START + datetime.timedelta(minutes=i)) for i in range(reply_count)])
+        db.session.commit()
+        return ticket.id
+
+
+def read_all(client, url, **params):
+    messages, cursor, pages = [], None, 0
+    while True:
+        response = client.get(url, query_string={**params, **({'cursor': cursor} if cursor else {})})
+        assert response.status_code == 200, response.get_data(as_text=True)
+        messages += [reply['message'] for reply in response.json['replies']]
+        pages += 1
+        cursor = response.json['next_cursor']
+        if cursor is None: return messages, pages
+
+
+def test_replies_page_oldest_first(app, users, login):
+    ticket_id = add_ticket(app, users['client1'], 5)
+    messages, pages = read_all(login('client1'), f'/api/support-tickets/{ticket_id}/replies', limit=2)
+    assert messages == [f'Reply {i}' for i in range(5)]
+    assert pages == 3
+
+
+def test_limit_is_capped(app, users, login):
+    ticket_id = add_ticket(app, users['client1'], app_module.TICKET_REPLIES_MAX_PAGE_SIZE + 5)
+    response = login('client1').get(f'/api/support-tickets/{ticket_id}/replies', query_string={'limit': 1000})
+    assert len(response.json['replies']) == app_module.TICKET_REPLIES_MAX_PAGE_SIZE
+    assert response.json['next_cursor'] == response.json['replies'][-1]['id']
+
+
+@pytest.mark.parametrize('params', [{'cursor': 'abc'}, {'cursor': '1.5'}, {'limit': 'many'}])
+def test_bad_cursor_or_limit_is_refused(app, users, login, params):
+    ticket_id = add_ticket(app, users['client1'], 3)
+    response = login('client1').get(f'/api/support-tickets/{ticket_id}/replies', query_string=params)
+    assert response.status_code == 400
+
+
+def test_other_clients_ticket_is_not_found(app, users, login):
+    ticket_id = add_ticket(app, users['client1'], 2)
+    assert login('client2').get(f'/api/support-tickets/{ticket_id}/replies').status_code == 404
+    assert login('client1').get(f'/api/support-tickets/{ticket_id + 1}/replies').status_code == 404
+
+
+def test_admin_mount_reads_any_ticket(app, users, login):
+    ticket_id = add_ticket(app, users['client1'], 3, replier_id=users['admin'])
+    messages, _ = read_all(login('admin'), f'/api/admin/support-tickets/{ticket_id}/replies')
+    assert messages == ['Reply 0', 'Reply 1', 'Reply 2']
+    reply = login('admin').get(f'/api/admin/support-tickets/{ticket_id}/replies').json['replies'][0]
+    assert (reply['author_username'], reply['author_role']) == ('admin', 'admin')
+
+
+def test_ticket_lists_carry_reply_summaries(app, users, login):
+    busy_id = add_ticket(app, users['client1'], 4)
+    quiet_id = add_ticket(app, users['client1'], 0)
+    last_reply_at = (START + datetime.timedelta(minutes=3)).isoformat()
+    expected = {busy_id: (4, last_reply_at), quiet_id: (0, None)}
+    for client, url, key in ((login('client1'), '/api/support-tickets', None),
+                             (login('admin'), '/api/admin/requests/support-tickets/all', 'tickets')):
+        body = client.get(url).json
+        tickets = body[key] if key else body
+        assert {t['id']: (t['replyCount'], t['lastReplyAt']) for t in tickets} == expected
+        assert all('replies' not in t for t in tickets)